@@ -2,31 +2,35 @@ import os
 import sys
 import subprocess
 import threading
+import queue
 import shutil
 import argparse
-from collections import deque
+import functools
+from collections import OrderedDict, deque
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import MemoryHandler, TimedRotatingFileHandler
 from datetime import datetime
 import importlib
 import re
 import json
+import locale
+import copy
+import csv
 import wave
 import time
 import tempfile
 import pkgutil
 import ctypes.util
 import shlex
+import http.client
+import select
+import selectors
+import signal
+import socket
 try:
-    import qdarkstyle
-except Exception:
-    qdarkstyle = None
-
-try:
-    import requests
-except Exception:
-    requests = None
-
+    import fcntl
+except ImportError:
+    fcntl = None
 try:
     import numpy as np
 except Exception:
@@ -59,30 +63,162 @@ if sys.platform.startswith("linux"):
 from PyQt5 import QtWidgets, QtCore
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import pyaudio
+
+# PyAudio und qdarkstyle werden erst bei Bedarf geladen (CLI ohne Audio braucht keins)
+pyaudio = None
+
+try:
+    import pyqtgraph as pg
+    import pyqtgraph.exporters
+except Exception:
+    pg = None
+
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+try:
+    from scipy.signal import butter, sosfilt
+except Exception:
+    butter = sosfilt = None
+
+
+def _lade_pyaudio():
+    """Lädt PyAudio beim ersten Audiostart."""
+    global pyaudio
+    if pyaudio is None:
+        import pyaudio as modul
+
+        pyaudio = modul
+    return pyaudio
+
+
+@functools.lru_cache(maxsize=None)
+def _lade_qdarkstyle():
+    """Lädt qdarkstyle beim ersten dunklen Theme; None, wenn es fehlt."""
+    try:
+        import qdarkstyle
+    except Exception:
+        return None
+    return qdarkstyle
 
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 LOG_DIR = os.path.expanduser("~")
 CONFIG_FILE = os.path.expanduser("~/.tetra_gui_config.json")
+SETUP_DONE_FILE = os.path.expanduser("~/.tetra_setup_done")
+SETUP_CHECK_MAX_AGE = 7 * 86400
 logger = logging.getLogger("tetra")
 handler = TimedRotatingFileHandler(
     os.path.join(LOG_DIR, "tetra.log"), when="midnight", backupCount=7, encoding="utf-8"
 )
 handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
 logger.setLevel(logging.INFO)
-logger.addHandler(handler)
+# Dekoderzeilen gesammelt schreiben; Rollover-Prüfung und Schreiben dann je Block
+LOG_BUFFER_RECORDS = 512
+logger.addHandler(
+    MemoryHandler(LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=handler)
+)
 
 
-def list_sdr_devices():
-    """Gibt eine Liste erkannter RTL-SDR-Geräte zurück."""
-    devices = []
+def _list_rtlsdr_via_library():
+    """Fragt RTL-SDR-Geräte direkt über librtlsdr ab (ohne Unterprozess)."""
+    lib_name = ctypes.util.find_library("rtlsdr")
+    if not lib_name:
+        return []
     try:
-        out = subprocess.check_output(
-            ["rtl_test", "-t"], text=True, stderr=subprocess.STDOUT, timeout=5
-        )
+        lib = ctypes.CDLL(lib_name)
+        lib.rtlsdr_get_device_count.restype = ctypes.c_uint32
+        lib.rtlsdr_get_device_name.argtypes = [ctypes.c_uint32]
+        lib.rtlsdr_get_device_name.restype = ctypes.c_char_p
+        lib.rtlsdr_get_device_usb_strings.argtypes = [
+            ctypes.c_uint32,
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+        ]
+        lib.rtlsdr_get_device_usb_strings.restype = ctypes.c_int
+        devices = []
+        for index in range(lib.rtlsdr_get_device_count()):
+            hersteller = ctypes.create_string_buffer(256)
+            produkt = ctypes.create_string_buffer(256)
+            seriennr = ctypes.create_string_buffer(256)
+            if lib.rtlsdr_get_device_usb_strings(index, hersteller, produkt, seriennr) == 0:
+                # Gleiche Beschriftung wie in der Ausgabe von rtl_test -t
+                name = (
+                    f"{hersteller.value.decode(errors='replace')}, "
+                    f"{produkt.value.decode(errors='replace')}, "
+                    f"SN: {seriennr.value.decode(errors='replace')}"
+                )
+            else:
+                name = (lib.rtlsdr_get_device_name(index) or b"RTL-SDR").decode(errors="replace")
+            devices.append((name, index))
+        return devices
+    except Exception:
+        return []
+
+
+# Geräteliste kurz zwischenspeichern, damit wiederholtes Suchen nicht jedes Mal rtl_test startet
+DEVICE_CACHE_TTL = 10.0
+_DEVICE_CACHE = {"devices": None, "time": 0.0}
+
+
+def list_sdr_devices(force: bool = False):
+    """Gibt eine Liste erkannter RTL-SDR-Geräte zurück; force umgeht den Zwischenspeicher."""
+    if (
+        not force
+        and _DEVICE_CACHE["devices"] is not None
+        and time.monotonic() - _DEVICE_CACHE["time"] < DEVICE_CACHE_TTL
+    ):
+        return list(_DEVICE_CACHE["devices"])
+    devices = _probe_sdr_devices(force)
+    _DEVICE_CACHE["devices"] = devices
+    _DEVICE_CACHE["time"] = time.monotonic()
+    return list(devices)
+
+
+_RTL_TEST_CACHE = {"out": None, "time": 0.0}
+# Langsam aufzählende Geräte brauchen teils mehrere Sekunden bis zur Geräteliste
+RTL_TEST_TIMEOUT = 5
+
+
+def _rtl_test_output(force: bool = False):
+    """Ausgabe von rtl_test -t, gemeinsam für Geräteliste und Gain-Werte zwischengespeichert."""
+    if (
+        not force
+        and _RTL_TEST_CACHE["out"] is not None
+        and time.monotonic() - _RTL_TEST_CACHE["time"] < DEVICE_CACHE_TTL
+    ):
+        return _RTL_TEST_CACHE["out"]
+    # Geräteliste und Gain-Werte stehen am Anfang der Ausgabe; der anschließende
+    # Test wird nach RTL_TEST_TIMEOUT abgebrochen und die bis dahin gelesene Ausgabe
+    # verwendet
+    try:
+        out = subprocess.run(
+            ["rtl_test", "-t"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=RTL_TEST_TIMEOUT,
+        ).stdout
+    except subprocess.TimeoutExpired as exc:
+        out = exc.output or ""
+        if isinstance(out, bytes):
+            out = out.decode("utf-8", "replace")
+    _RTL_TEST_CACHE["out"] = out
+    _RTL_TEST_CACHE["time"] = time.monotonic()
+    return out
+
+
+def _probe_sdr_devices(force: bool = False):
+    devices = _list_rtlsdr_via_library()
+    if devices:
+        return devices
+    try:
+        out = _rtl_test_output(force)
         for line in out.splitlines():
-            match = re.match(r"^\s*(\d+):\s*(.+)$", line)
+            match = _RTL_DEVICE_RE.match(line)
             if match:
                 index = int(match.group(1))
                 name = match.group(2).strip()
@@ -91,11 +227,11 @@ def list_sdr_devices():
         pass
     if not devices:
         try:
-            out = subprocess.check_output(["lsusb"], text=True, timeout=5)
+            out = subprocess.check_output(["lsusb"], text=True, timeout=2)
             for line in out.splitlines():
                 if "RTL" in line or "Realtek" in line:
                     label = line.strip()
-                    match = re.match(r"^Bus\s+\d+\s+Device\s+\d+:\s*(.+)$", label)
+                    match = _LSUSB_RE.match(label)
                     if match:
                         label = match.group(1).strip()
                     devices.append((label, None))
@@ -104,42 +240,305 @@ def list_sdr_devices():
     return devices or [("RTL-SDR", 0)]
 
 
-def extract_talkgroup_ids(line: str):
-    muster = re.compile(
-        r"\b(?:TGID|TG|talkgroup|group)\s*[:=]?\s*(0x[0-9A-Fa-f]+|\d+)\b",
-        re.IGNORECASE,
-    )
-    ids = []
-    for match in muster.finditer(line):
+@functools.lru_cache(maxsize=None)
+def _std_icon(sp):
+    """Standardsymbol des Anwendungsstils, je Symbol nur einmal erzeugt.
+
+    Erst nach dem Setzen des Stils (QApplication.setStyle) aufrufen.
+    """
+    return QtWidgets.QApplication.style().standardIcon(sp)
+
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str):
+    """Zwischengespeichertes shutil.which, um PATH nur einmal je Befehl abzusuchen."""
+    return shutil.which(cmd)
+
+
+_TG_RE = re.compile(
+    r"\b(?:TGID|TG|talkgroup|group)\s*[:=]?\s*(0x[0-9A-Fa-f]+|\d+)\b",
+    re.IGNORECASE,
+)
+
+_CELL_RE = re.compile(
+    r"Cell\s*ID[:=]\s*(\w+).*LAC[:=]\s*(\w+).*MCC[:=]\s*(\d+).*MNC[:=]\s*(\d+)",
+    re.IGNORECASE,
+)
+
+_TG_SPLIT_RE = re.compile(r"[,\s]+")
+_RTL_DEVICE_RE = re.compile(r"^\s*(\d+):\s*(.+)$")
+_LSUSB_RE = re.compile(r"^Bus\s+\d+\s+Device\s+\d+:\s*(.+)$")
+_GAIN_VALUES_RE = re.compile(r"gain values", re.IGNORECASE)
+_FLOAT_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def compile_filter_regex(text: str):
+    """Benutzerfilter einmal kompilieren; leere oder ungültige Muster filtern nicht."""
+    if not text:
+        return None
+    try:
+        return re.compile(text)
+    except re.error:
+        return None
+
+
+# Gemeinsames leeres Ergebnis für die vielen Zeilen ohne Sprechgruppe
+_NO_IDS = ()
+
+
+def extract_talkgroup_ids(line: str, klein: str = None):
+    # Jeder Treffer von _TG_RE enthält "tg" oder "group"; sonst Regex sparen
+    if klein is None:
+        klein = line.lower()
+    if "tg" not in klein and "group" not in klein:
+        return _NO_IDS
+    ids = None
+    for match in _TG_RE.finditer(line):
         raw = match.group(1)
-        try:
-            value = int(raw, 0)
-            ids.append(str(value))
-        except ValueError:
+        if raw[:2] in ("0x", "0X"):
+            raw = str(int(raw, 16))
+        elif raw[0] == "0" and not raw.strip("0"):
+            raw = "0"
+        # Dezimalzahl ohne führende Nullen ist bereits ihre eigene Darstellung;
+        # mit führenden Nullen blieb sie schon bisher unverändert
+        if ids is None:
+            ids = [raw]
+        else:
             ids.append(raw)
-    return ids
+    return ids if ids is not None else _NO_IDS
+
+
+# Bis zu so vielen ausgewählten Sprechgruppen lohnt die Teilstring-Vorprüfung
+TG_PREFILTER_MAX = 8
+
+
+def talkgroup_prefilter(selected):
+    """Auswahl als Tupel für die Teilstring-Vorprüfung oder None."""
+    if 0 < len(selected) <= TG_PREFILTER_MAX:
+        return tuple(selected)
+    return None
+
+
+def mentions_talkgroup(line: str, klein: str, texte) -> bool:
+    """Kann die Zeile eine der IDs enthalten? Günstige Prüfung vor der Regex."""
+    # Hex-IDs werden in Dezimal umgerechnet und stehen so nicht wörtlich in der Zeile
+    if texte is None or "0x" in klein:
+        return True
+    return any(t in line for t in texte)
+
+
+def match_cell_info(line: str, klein: str = None):
+    """Zellfelder (cell, lac, mcc, mnc) oder None; Regex nur für Kandidatenzeilen."""
+    if klein is None:
+        klein = line.lower()
+    if "cell" not in klein or "lac" not in klein:
+        return None
+    m = _CELL_RE.search(line)
+    return m.groups() if m else None
+
+
+_CONFIG_CACHE = {"mtime": None, "data": None}
+
+
+# Telegram-Meldungen sammeln und höchstens alle 5 s als eine Nachricht senden
+TELEGRAM_FLUSH_INTERVAL = 5.0
+TELEGRAM_MAX_LEN = 4096
+TELEGRAM_HOST = "api.telegram.org"
+
+
+class TelegramSender:
+    """Bündelt Telegram-Meldungen in einem einzigen Hintergrund-Thread."""
+
+    def __init__(self, interval: float = TELEGRAM_FLUSH_INTERVAL):
+        self._interval = interval
+        self._queue = queue.Queue()
+        self._thread = None
+        # Eine Keep-Alive-Verbindung für alle Meldungen, nur im Sender-Thread benutzt
+        self._conn = None
+
+    def send(self, token: str, chat: str, text: str):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._queue.put((token, chat, text))
+
+    def _run(self):
+        while True:
+            eintraege = [self._queue.get()]
+            frist = time.monotonic() + self._interval
+            while True:
+                rest = frist - time.monotonic()
+                if rest <= 0:
+                    break
+                try:
+                    eintraege.append(self._queue.get(timeout=rest))
+                except queue.Empty:
+                    break
+            # Pro Empfänger eine Nachricht, innerhalb des Telegram-Limits
+            gruppen = OrderedDict()
+            for token, chat, text in eintraege:
+                gruppen.setdefault((token, chat), []).append(text)
+            for (token, chat), texte in gruppen.items():
+                nachricht = "\n".join(texte)
+                while nachricht:
+                    self._post(token, chat, nachricht[:TELEGRAM_MAX_LEN])
+                    nachricht = nachricht[TELEGRAM_MAX_LEN:]
+
+    def _post(self, token: str, chat: str, text: str):
+        """Sendet eine Nachricht über die Bot-API und hält die TLS-Verbindung offen."""
+        body = json.dumps({"chat_id": chat, "text": text}).encode("utf-8")
+        # Eine vom Server geschlossene Leerlaufverbindung einmal neu aufbauen; nur bei
+        # Fehlern, nach denen die Anfrage sicher nicht angekommen ist (kein Doppelversand)
+        for _ in range(2):
+            wiederverwendet = self._conn is not None
+            if self._conn is None:
+                self._conn = http.client.HTTPSConnection(TELEGRAM_HOST, timeout=10)
+            try:
+                self._conn.request(
+                    "POST",
+                    f"/bot{token}/sendMessage",
+                    body=body,
+                    headers={"Content-Type": "application/json"},
+                )
+                resp = self._conn.getresponse()
+                antwort = resp.read()
+            except (BrokenPipeError, ConnectionResetError) as exc:
+                # RemoteDisconnected ist eine Unterklasse von ConnectionResetError
+                self._conn.close()
+                self._conn = None
+                if wiederverwendet:
+                    continue
+                logger.info(f"Telegram-Nachricht fehlgeschlagen: {exc}")
+                return
+            except Exception as exc:
+                self._conn.close()
+                self._conn = None
+                logger.info(f"Telegram-Nachricht fehlgeschlagen: {exc}")
+                return
+            if not 200 <= resp.status < 300:
+                # z. B. 401 bei falschem Token oder 429 bei Ratenbegrenzung
+                logger.info(
+                    f"Telegram-Nachricht fehlgeschlagen: HTTP {resp.status} "
+                    f"{antwort.decode('utf-8', 'replace')}"
+                )
+            return
 
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return {}
+    # Unveränderte Datei nicht erneut parsen
+    if _CONFIG_CACHE["mtime"] != mtime:
         try:
             with open(CONFIG_FILE, "r") as fh:
-                return json.load(fh)
+                data = json.load(fh)
         except Exception:
             return {}
-    return {}
+        _CONFIG_CACHE["mtime"] = mtime
+        _CONFIG_CACHE["data"] = data
+    return copy.deepcopy(_CONFIG_CACHE["data"])
 
 
 def save_config(cfg: dict):
+    # Unveränderte Einstellungen nicht erneut schreiben, solange die Datei nicht
+    # von außen geändert wurde
+    if cfg == _CONFIG_CACHE["data"]:
+        try:
+            if os.stat(CONFIG_FILE).st_mtime_ns == _CONFIG_CACHE["mtime"]:
+                return
+        except OSError:
+            pass
+    # Erst temporär schreiben und dann atomar ersetzen, damit keine halbe Datei entsteht
+    tmp_file = CONFIG_FILE + ".tmp"
     try:
-        with open(CONFIG_FILE, "w") as fh:
+        with open(tmp_file, "w") as fh:
             json.dump(cfg, fh, indent=2)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
+        # Gespeicherten Stand merken, damit load_config die Datei nicht neu parst
+        _CONFIG_CACHE["mtime"] = os.stat(CONFIG_FILE).st_mtime_ns
+        _CONFIG_CACHE["data"] = copy.deepcopy(cfg)
     except Exception:
         pass
 
 
 _MAX_GAIN_CACHE = None
 
+# rtl_power-Zeile: Datum, Zeit, Hz low, Hz high, Hz step, Samples, dB...
+RTL_POWER_HEAD_FIELDS = 6
+
+# Hinweise auf verschlüsselte Aussendungen in der tetra-rx-Ausgabe
+_ENCRYPTED_RE = re.compile(rb"CACH|LIP")
+
+# Prozessgruppen gibt es nur auf POSIX-Systemen
+_HAS_KILLPG = hasattr(os, "killpg")
+
+
+def _enlarge_pipe(fd: int, size: int):
+    """Vergrößert den Kernel-Puffer einer Pipe (nur Linux, sonst wirkungslos)."""
+    if fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    try:
+        fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, size)
+    except OSError:
+        pass
+
+
+def _iter_line_blocks(stream, size: int):
+    """Liefert je read1()-Block die Liste der darin vollständigen Zeilen."""
+    teile = []
+    while True:
+        block = stream.read1(size)
+        if not block:
+            break
+        if b"\n" not in block:
+            teile.append(block)
+            continue
+        zeilen = block.split(b"\n")
+        teile.append(zeilen[0])
+        zeilen[0] = b"".join(teile)
+        teile = [zeilen.pop()]
+        if not teile[0]:
+            teile.clear()
+        yield zeilen
+    if teile:
+        yield [b"".join(teile)]
+
+
+PACKET_TYPES = ("SDS", "MM", "CM")
+
+
+def packet_type(line: str) -> str:
+    """Erster passender Pakettyp in fester Reihenfolge oder ""."""
+    # Drei Teilstring-Suchen sind für kurze Zeilen schneller als eine Regex
+    for t in PACKET_TYPES:
+        if t in line:
+            return t
+    return ""
+
+
+CELL_FIELDS = ("cell", "lac", "mcc", "mnc", "freq")
+MAX_CELLS = 5000
+# Sammelzeit für gepufferte Ausgaben im CLI-Modus
+CLI_FLUSH_MS = 50
+# Zeilenlimit für Log- und Dekoderausgabe, ältere Zeilen werden verworfen
+MAX_OUTPUT_LINES = 5000
+TALKGROUP_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+CELL_CSV_HEADER = ("Zelle", "LAC", "MCC", "MNC", "Frequenz")
+
+
+def write_cells_csv(path: str, cells):
+    """Schreibt Zellinformationen mit korrekter CSV-Maskierung."""
+    with open(path, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(CELL_CSV_HEADER)
+        writer.writerows(
+            [cell.get(feld, "") for feld in CELL_FIELDS] for cell in cells
+        )
+
 
 def _normalize_gain_setting(value):
     if value is None:
@@ -171,20 +570,16 @@ def _parse_gain_argument(parser: argparse.ArgumentParser, value):
 
 
 def _parse_gain_values_from_rtl_test(output: str):
-    gains = []
-    in_section = False
-    for line in output.splitlines():
-        if re.search(r"gain values", line, re.IGNORECASE):
-            in_section = True
-        if in_section:
-            gains.extend(
-                float(value) for value in re.findall(r"-?\d+(?:\.\d+)?", line)
-            )
-            if not line.strip():
-                in_section = False
-        if in_section and re.search(r"sampling", line, re.IGNORECASE):
-            in_section = False
-    return max(gains) if gains else None
+    # rtl_test listet alle Werte in einer Zeile: "Supported gain values (29): 0.0 ... 49.6"
+    m = _GAIN_VALUES_RE.search(output)
+    if not m:
+        return None
+    ende = output.find("\n", m.end())
+    werte = output[m.end() : ende if ende >= 0 else len(output)]
+    # Die Anzahl in Klammern vor dem Doppelpunkt ist kein Gain-Wert
+    werte = werte.partition(":")[2] or werte
+    gains = _FLOAT_RE.findall(werte)
+    return max(map(float, gains)) if gains else None
 
 
 def _ermittle_max_gain():
@@ -193,9 +588,7 @@ def _ermittle_max_gain():
         return _MAX_GAIN_CACHE
     fallback_gain = 49.6
     try:
-        out = subprocess.check_output(
-            ["rtl_test", "-t"], text=True, stderr=subprocess.STDOUT, timeout=5
-        )
+        out = _rtl_test_output()
     except Exception:
         _MAX_GAIN_CACHE = fallback_gain
         return _MAX_GAIN_CACHE
@@ -235,11 +628,12 @@ def _qt_xcb_verfuegbar() -> bool:
 
     for basis in filter(None, plugin_pfade):
         plattform_dir = os.path.join(basis, "platforms")
-        if not os.path.isdir(plattform_dir):
-            continue
+        # Üblicher Dateiname zuerst, erst dann das Verzeichnis durchsuchen
+        if os.path.exists(os.path.join(plattform_dir, "libqxcb.so")):
+            return True
         try:
-            for datei in os.listdir(plattform_dir):
-                if datei.startswith("libqxcb.so"):
+            with os.scandir(plattform_dir) as eintraege:
+                if any(e.name.startswith("libqxcb.so") for e in eintraege):
                     return True
         except OSError:
             continue
@@ -444,7 +838,7 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
             if found:
                 ids.update(found)
             else:
-                for part in re.split(r"[,\s]+", token):
+                for part in _TG_SPLIT_RE.split(token):
                     part = part.strip()
                     if part:
                         ids.add(part)
@@ -456,17 +850,16 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
         override_config = True
 
     if args.talkgroups_file:
-        file_ids = set()
         try:
             with open(args.talkgroups_file, "r") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    file_ids.update(_parse_talkgroup_tokens([line]))
+                daten = fh.read()
         except OSError as exc:
             print(f"Warnung: Konnte Sprechgruppen-Datei nicht lesen: {exc}", file=sys.stderr)
         else:
+            # Alle Zeilen in einem Durchlauf in dieselbe Menge zerlegen
+            file_ids = _parse_talkgroup_tokens(
+                line for line in daten.splitlines() if not line.lstrip().startswith("#")
+            )
             selected_talkgroups = file_ids
             config["selected_talkgroups"] = sorted(selected_talkgroups)
             override_config = True
@@ -518,6 +911,7 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
             self._decoder.device_id = device_id
             self._scanner.device_id = device_id
             self._current_frequency = None
+            self._freq_mhz3 = ""
             self._last_peak = None
             self._last_spectrum = None
             self._freq_range_mhz = freq_range_mhz
@@ -525,14 +919,25 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
             self._play_audio = play_audio
             self._record_audio = record_audio
             self._filter_regex = filter_regex
+            self._filter_re = compile_filter_regex(filter_regex)
             self.selected_talkgroups = selected_talkgroups
+            # Auswahl steht nach dem Start fest; None heißt: keine Einschränkung
+            self._tg_filter = frozenset(selected_talkgroups) or None
+            self._tg_texte = talkgroup_prefilter(selected_talkgroups)
             self._export_csv_path = export_csv_path
             self._stats_enabled = stats_enabled
-            self.cells = {}
-            self.packet_counts = {}
+            self.cells = OrderedDict()
+            self.packet_counts = {t: 0 for t in PACKET_TYPES}
             self.talkgroups = {}
             self._manual_lock = False
             self._stdin_thread = None
+            self._stdin_notifier = None
+            self._stdin_rest = b""
+            # Laufende Ausgaben gepuffert schreiben und gesammelt ausgeben
+            self._flush_timer = QtCore.QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(CLI_FLUSH_MS)
+            self._flush_timer.timeout.connect(sys.stdout.flush)
             self._dec_audio_player = None
             if self._play_audio:
                 self._dec_audio_player = DecodedAudioPlayer(parent=self)
@@ -541,6 +946,7 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
             self._scanner.spectrum_ready.connect(self._handle_spectrum)
             self._scanner.frequency_selected.connect(self._handle_frequency)
             self._decoder.output.connect(self._handle_decoder_output)
+            self._decoder.lines.connect(self._handle_decoder_lines)
             self._decoder.finished.connect(self._decoder_finished)
 
         def start(self):
@@ -555,7 +961,14 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
             if self._dec_audio_player:
                 self._dec_audio_player.stop()
 
+        def _ausgabe(self, text: str):
+            sys.stdout.write(text + "\n")
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
         def finalize(self):
+            self._flush_timer.stop()
+            sys.stdout.flush()
             if self._export_csv_path:
                 self.export_cells_csv(self._export_csv_path)
             if self._stats_enabled:
@@ -565,15 +978,24 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
         def _handle_spectrum(self, freqs, powers):
             if freqs is None or powers is None or len(freqs) == 0 or len(powers) == 0:
                 return
-            self._last_spectrum = (np.array(freqs, copy=True), np.array(powers, copy=True))
+            # Der Scanner verwendet seine Puffer weiter; gleich große Kopien wiederverwenden
+            last = self._last_spectrum
+            if (
+                last is not None
+                and last[0].shape == freqs.shape
+                and last[0].dtype == freqs.dtype
+                and last[1].shape == powers.shape
+                and last[1].dtype == powers.dtype
+            ):
+                np.copyto(last[0], freqs)
+                np.copyto(last[1], powers)
+            else:
+                self._last_spectrum = (freqs.copy(), powers.copy())
             max_idx = int(np.argmax(powers))
             freq = float(freqs[max_idx])
             power = float(powers[max_idx])
             self._last_peak = (freq, power)
-            print(
-                f"Frequenz {freq/1e6:.3f} MHz, Leistung {power:.1f} dB",
-                flush=True,
-            )
+            self._ausgabe(f"Frequenz {freq/1e6:.3f} MHz, Leistung {power:.1f} dB")
 
         @QtCore.pyqtSlot(float)
         def _handle_frequency(self, freq):
@@ -589,6 +1011,7 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
 
         def _set_frequency_and_process(self, freq: float, source: str = "manual"):
             self._current_frequency = freq
+            self._freq_mhz3 = f"{freq/1e6:.3f}"
             if source == "manual":
                 print(f"Manuell ausgewählt: {freq/1e6:.3f} MHz", flush=True)
             else:
@@ -605,30 +1028,29 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
                 self._dec_audio_player.start(record=self._record_audio)
             self._decoder.start(freq)
 
+        @QtCore.pyqtSlot(list)
+        def _handle_decoder_lines(self, lines: list):
+            for line in lines:
+                self._handle_decoder_output(line)
+
         @QtCore.pyqtSlot(str)
         def _handle_decoder_output(self, line: str):
-            if not self._line_matches_selected_talkgroup(line):
+            # Günstigste Prüfung zuerst, Sprechgruppen nur einmal je Zeile suchen
+            if self._filter_re is not None and not self._filter_re.search(line):
                 return
-            if self._filter_regex:
-                try:
-                    if not re.search(self._filter_regex, line):
-                        return
-                except re.error:
-                    pass
-            print(line, flush=True)
-            self.parse_cell_info(line)
+            klein = line.lower()
+            if not mentions_talkgroup(line, klein, self._tg_texte):
+                return
+            ids = extract_talkgroup_ids(line, klein)
+            if self._tg_filter is not None and self._tg_filter.isdisjoint(ids):
+                return
+            self._ausgabe(line)
+            self.parse_cell_info(line, klein)
             self.parse_packet_type(line)
-            self.parse_talkgroups(line)
-            for tg_id in extract_talkgroup_ids(line):
-                print(f"Talkgroup {tg_id} empfangen", flush=True)
-
-        def _line_matches_selected_talkgroup(self, line: str) -> bool:
-            if not self.selected_talkgroups:
-                return True
-            ids = extract_talkgroup_ids(line)
-            if not ids:
-                return False
-            return any(tg_id in self.selected_talkgroups for tg_id in ids)
+            if ids:
+                self.parse_talkgroups(line, ids)
+                for tg_id in ids:
+                    self._ausgabe(f"Talkgroup {tg_id} empfangen")
 
         @QtCore.pyqtSlot()
         def _decoder_finished(self):
@@ -644,12 +1066,45 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
         def _start_cli_input_thread(self):
             if self._stdin_thread and self._stdin_thread.is_alive():
                 return
+            if self._stdin_notifier is not None:
+                return
+            if sys.platform != "win32":
+                # Eingaben direkt in der Qt-Ereignisschleife lesen, ohne eigenen Thread
+                try:
+                    fd = sys.stdin.fileno()
+                except (AttributeError, ValueError, OSError):
+                    return
+                self._stdin_notifier = QtCore.QSocketNotifier(
+                    fd, QtCore.QSocketNotifier.Read, self
+                )
+                self._stdin_notifier.activated.connect(self._read_cli_input)
+                return
             self._stdin_thread = threading.Thread(
                 target=self._cli_input_loop,
                 daemon=True,
             )
             self._stdin_thread.start()
 
+        def _read_cli_input(self, fd):
+            try:
+                block = os.read(fd, 4096)
+            except BlockingIOError:
+                return
+            except OSError:
+                block = b""
+            if not block:
+                # Dateiende: sonst meldet der Notifier stdin ununterbrochen als lesbar
+                self._stdin_notifier.setEnabled(False)
+                block, self._stdin_rest = self._stdin_rest, b""
+                zeilen = [block] if block else []
+            else:
+                zeilen = (self._stdin_rest + block).split(b"\n")
+                self._stdin_rest = zeilen.pop()
+            for zeile in zeilen:
+                cmd = zeile.decode("utf-8", "replace").strip()
+                if cmd:
+                    self._handle_cli_command(cmd)
+
         def _cli_input_loop(self):
             while True:
                 try:
@@ -736,13 +1191,7 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
 
         def export_cells_csv(self, path: str):
             try:
-                with open(path, "w") as fh:
-                    fh.write("Zelle,LAC,MCC,MNC,Frequenz\n")
-                    for cell in self.cells.values():
-                        fh.write(
-                            f"{cell.get('cell','')},{cell.get('lac','')},"
-                            f"{cell.get('mcc','')},{cell.get('mnc','')},{cell.get('freq','')}\n"
-                        )
+                write_cells_csv(path, self.cells.values())
             except OSError as exc:
                 print(f"Konnte CSV nicht schreiben: {exc}", file=sys.stderr, flush=True)
             else:
@@ -751,10 +1200,11 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
         def print_stats(self):
             print("\nStatistik (CLI):", flush=True)
             print(f"- Zellen erkannt: {len(self.cells)}", flush=True)
-            if self.packet_counts:
+            if any(self.packet_counts.values()):
                 paket_teile = ", ".join(
                     f"{typ}: {anzahl}"
                     for typ, anzahl in sorted(self.packet_counts.items())
+                    if anzahl
                 )
                 print(f"- Pakettypen: {paket_teile}", flush=True)
             else:
@@ -775,43 +1225,48 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
             else:
                 print("- Sprechgruppen: keine", flush=True)
 
-        def parse_cell_info(self, line: str):
-            m = re.search(
-                r"Cell\s*ID[:=]\s*(\w+).*LAC[:=]\s*(\w+).*MCC[:=]\s*(\d+).*MNC[:=]\s*(\d+)",
-                line,
-                re.I,
-            )
-            if not m:
+        def parse_cell_info(self, line: str, klein: str = None):
+            felder = match_cell_info(line, klein)
+            if felder is None:
                 return
-            freq_text = ""
-            if self._current_frequency is not None:
-                freq_text = f"{self._current_frequency/1e6:.3f}"
+            alt = self.cells.get(felder[0])
+            if alt is not None:
+                self.cells.move_to_end(felder[0])
+                # Wiederholte Meldung derselben Zelle: nichts neu anlegen
+                if (alt["lac"], alt["mcc"], alt["mnc"], alt["freq"]) == (
+                    *felder[1:],
+                    self._freq_mhz3,
+                ):
+                    return
             cell = {
-                "cell": m.group(1),
-                "lac": m.group(2),
-                "mcc": m.group(3),
-                "mnc": m.group(4),
-                "freq": freq_text,
+                "cell": felder[0],
+                "lac": felder[1],
+                "mcc": felder[2],
+                "mnc": felder[3],
+                "freq": self._freq_mhz3,
             }
             self.cells[cell["cell"]] = cell
+            while len(self.cells) > MAX_CELLS:
+                self.cells.popitem(last=False)
 
         def parse_packet_type(self, line: str):
-            types = ["SDS", "MM", "CM"]
-            for t in types:
-                if t in line:
-                    self.packet_counts[t] = self.packet_counts.get(t, 0) + 1
-                    break
+            t = packet_type(line)
+            if t:
+                self.packet_counts[t] += 1
 
-        def parse_talkgroups(self, line: str):
-            ids = extract_talkgroup_ids(line)
+        def parse_talkgroups(self, line: str, ids=None):
+            if ids is None:
+                ids = extract_talkgroup_ids(line)
             if not ids:
                 return
-            now = datetime.now()
+            # Zeitstempel wird im CLI nur gespeichert, nie angezeigt
+            now = time.time()
             for tg_id in ids:
-                info = self.talkgroups.get(tg_id, {"count": 0, "last_seen": now})
-                info["count"] = info.get("count", 0) + 1
+                info = self.talkgroups.get(tg_id)
+                if info is None:
+                    info = self.talkgroups[tg_id] = {"count": 0}
+                info["count"] += 1
                 info["last_seen"] = now
-                self.talkgroups[tg_id] = info
 
     if device_id is None:
         device_text = "ohne Index"
@@ -843,15 +1298,40 @@ def _starte_cli_modus(fehlermeldung: str) -> None:
         args.export_csv,
         args.stats,
     )
-    runner.start()
+    def _beenden(*_):
+        app.quit()
+
+    def _weckbytes_leeren(_):
+        try:
+            weck_r.recv(64)
+        except OSError:
+            pass
+
+    # Qt-Ereignisschleife statt Abfrageschleife; Strg+C weckt sie über ein Socketpaar,
+    # damit der Python-Signalhandler ohne Polling-Timer zum Zug kommt
+    weck_r, weck_w = socket.socketpair()
+    weck_r.setblocking(False)
+    weck_w.setblocking(False)
+    signal.set_wakeup_fd(weck_w.fileno())
+    signal.signal(signal.SIGINT, _beenden)
+    notifier = QtCore.QSocketNotifier(weck_r.fileno(), QtCore.QSocketNotifier.Read)
+    notifier.activated.connect(_weckbytes_leeren)
+
+    # Auch am Terminal nicht jede Zeile einzeln schreiben; der Runner leert gesammelt
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False)
+    QtCore.QTimer.singleShot(0, runner.start)
     try:
-        while True:
-            app.processEvents()
-            time.sleep(0.1)
-    except KeyboardInterrupt:
-        print("\nCLI-Modus beendet.")
-        runner.stop()
-        runner.finalize()
+        app.exec_()
+    finally:
+        signal.set_wakeup_fd(-1)
+        notifier.setEnabled(False)
+        weck_r.close()
+        weck_w.close()
+    print("\nCLI-Modus beendet.")
+    runner.stop()
+    runner.finalize()
 
 
 class SetupWorker(QtCore.QThread):
@@ -870,7 +1350,14 @@ class SetupWorker(QtCore.QThread):
     DEMOD_ALTERNATIVES = ("demod_float", "float_to_bits")
     DEMOD_PKG = "osmocom-tetra"
 
-    PY_MODULES = ["pyaudio", "numpy", "matplotlib", "PyQt5", "requests", "qdarkstyle"]
+    PY_MODULES = [
+        "pyaudio",
+        "numpy",
+        "matplotlib",
+        "PyQt5",
+        "qdarkstyle",
+        "pyqtgraph",
+    ]
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -879,19 +1366,32 @@ class SetupWorker(QtCore.QThread):
     @classmethod
     def detect_missing_requirements(cls):
         """Gibt ein Tupel mit fehlenden Befehlen, Modulen und optionalen Werkzeugen zurück."""
-        missing_cmds = [cmd for cmd in cls.REQUIRED_CMDS if not shutil.which(cmd)]
-        if not any(shutil.which(cmd) for cmd in cls.DEMOD_ALTERNATIVES):
+        missing_cmds = [cmd for cmd in cls.REQUIRED_CMDS if not _which(cmd)]
+        if not any(_which(cmd) for cmd in cls.DEMOD_ALTERNATIVES):
             missing_cmds.append("demod_float/float_to_bits")
         missing_mods = [mod for mod in cls.PY_MODULES if not cls._has_module(mod)]
         missing_optional = []
 
-        if sys.platform.startswith("win") and shutil.which("choco") and not shutil.which("zadig"):
+        if sys.platform.startswith("win") and _which("choco") and not _which("zadig"):
             missing_optional.append("zadig")
 
         return missing_cmds, missing_mods, missing_optional
 
+    @staticmethod
+    def setup_recently_done() -> bool:
+        """True, wenn die Einrichtung innerhalb der letzten Woche abgeschlossen wurde."""
+        try:
+            alter = time.time() - os.path.getmtime(SETUP_DONE_FILE)
+        except OSError:
+            return False
+        return alter < SETUP_CHECK_MAX_AGE
+
     @staticmethod
     def _has_module(name: str) -> bool:
+        # Bereits geladene Module ohne Importmaschinerie erkennen; Fehlschläge nicht
+        # merken, da run() nach einer Installation erneut prüft
+        if name in sys.modules:
+            return True
         try:
             importlib.import_module(name)
             return True
@@ -900,19 +1400,19 @@ class SetupWorker(QtCore.QThread):
 
     def run(self):
         for cmd, pkg in self.REQUIRED_CMDS.items():
-            if shutil.which(cmd):
+            if _which(cmd):
                 continue
-            if self._run_install_script() and shutil.which(cmd):
+            if self._run_install_script() and _which(cmd):
                 continue
             if sys.platform.startswith("linux"):
                 self.log.emit(f"Installiere {cmd} über apt ({pkg})")
                 self._run_cmd(["sudo", "apt-get", "install", "-y", pkg])
             elif sys.platform.startswith("win"):
                 if pkg in ("rtl-sdr", "osmocom-tetra"):
-                    if self._run_install_script() and shutil.which(cmd):
+                    if self._run_install_script() and _which(cmd):
                         continue
                     self.log.emit(f"{cmd} fehlt - bitte {pkg} manuell installieren")
-                elif shutil.which("choco"):
+                elif _which("choco"):
                     self.log.emit(f"Installiere {cmd} über choco ({pkg})")
                     self._run_cmd(["choco", "install", "-y", pkg])
                 else:
@@ -920,9 +1420,9 @@ class SetupWorker(QtCore.QThread):
             else:
                 self.log.emit(f"{cmd} fehlt - bitte {pkg} manuell installieren")
 
-        if not any(shutil.which(cmd) for cmd in self.DEMOD_ALTERNATIVES):
+        if not any(_which(cmd) for cmd in self.DEMOD_ALTERNATIVES):
             if self._run_install_script() and any(
-                shutil.which(cmd) for cmd in self.DEMOD_ALTERNATIVES
+                _which(cmd) for cmd in self.DEMOD_ALTERNATIVES
             ):
                 pass
             elif sys.platform.startswith("linux"):
@@ -934,7 +1434,7 @@ class SetupWorker(QtCore.QThread):
             elif sys.platform.startswith("win"):
                 if self.DEMOD_PKG in ("rtl-sdr", "osmocom-tetra"):
                     if self._run_install_script() and any(
-                        shutil.which(cmd) for cmd in self.DEMOD_ALTERNATIVES
+                        _which(cmd) for cmd in self.DEMOD_ALTERNATIVES
                     ):
                         pass
                     else:
@@ -943,7 +1443,7 @@ class SetupWorker(QtCore.QThread):
                             f"{self.DEMOD_ALTERNATIVES[1]} fehlt - bitte "
                             f"{self.DEMOD_PKG} manuell installieren"
                         )
-                elif shutil.which("choco"):
+                elif _which("choco"):
                     self.log.emit(
                         f"Installiere {self.DEMOD_ALTERNATIVES[0]} oder "
                         f"{self.DEMOD_ALTERNATIVES[1]} über choco ({self.DEMOD_PKG})"
@@ -970,16 +1470,15 @@ class SetupWorker(QtCore.QThread):
             self.log.emit(f"Installiere Python-Modul {mod}")
             self._run_cmd([sys.executable, "-m", "pip", "install", mod])
 
-        if sys.platform.startswith("win") and shutil.which("choco") and not shutil.which("zadig"):
-            if self._run_install_script() and shutil.which("zadig"):
+        if sys.platform.startswith("win") and _which("choco") and not _which("zadig"):
+            if self._run_install_script() and _which("zadig"):
                 pass
             else:
                 self.log.emit("Installiere Zadig über choco")
                 self._run_cmd(["choco", "install", "-y", "zadig"])
 
-        setup_file = os.path.expanduser("~/.tetra_setup_done")
         try:
-            with open(setup_file, "w"):
+            with open(SETUP_DONE_FILE, "w"):
                 pass
         except Exception:
             pass
@@ -987,12 +1486,36 @@ class SetupWorker(QtCore.QThread):
 
     def _run_cmd(self, cmd):
         try:
-            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            for line in proc.stdout:
-                self.log.emit(line.rstrip())
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            # Alles gerade Verfügbare als ein Signal melden statt eines je Zeile;
+            # read1 wartet nicht auf weitere Zeilen, es entsteht also keine Verzögerung
+            # Gleiche Kodierung wie zuvor im Textmodus (z. B. cp1252 unter Windows)
+            kodierung = locale.getpreferredencoding(False)
+            rest = b""
+            while True:
+                block = proc.stdout.read1(65536)
+                if not block:
+                    break
+                daten = rest + block
+                # Auch bei bloßem \r schneiden: pip/apt zeichnen Fortschritt ohne \n neu
+                ende = max(daten.rfind(b"\n"), daten.rfind(b"\r"))
+                if ende == len(daten) - 1 and daten[ende] == 0x0D:
+                    # \r am Blockende kann zu \r\n gehören; bis zum nächsten Block warten
+                    ende = max(daten.rfind(b"\n", 0, ende), daten.rfind(b"\r", 0, ende))
+                if ende < 0:
+                    rest = daten
+                    continue
+                rest = daten[ende + 1 :]
+                text = daten[:ende].decode(kodierung, "replace")
+                self.log.emit("\n".join(z.rstrip() for z in text.splitlines()))
+            if rest:
+                self.log.emit(rest.decode(kodierung, "replace").rstrip())
             proc.wait()
         except Exception as exc:
             self.log.emit(f"Konnte {' '.join(cmd)} nicht ausführen: {exc}")
+        # Nach einer Installation müssen Befehle und Module neu gesucht werden
+        _which.cache_clear()
+        importlib.invalidate_caches()
 
     def _run_install_script(self) -> bool:
         if self._install_script_ran:
@@ -1027,12 +1550,48 @@ class SetupWorker(QtCore.QThread):
 
 
 
+class _RequirementCheckSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(list, list, list)
+
+
+class RequirementCheck(QtCore.QRunnable):
+    """Führt SetupWorker.detect_missing_requirements im Thread-Pool aus."""
+
+    def __init__(self):
+        super().__init__()
+        # Der Thread-Pool löscht den Runnable nach run(); das Fenster hält nur die Signale
+        self.signals = _RequirementCheckSignals()
+
+    def run(self):
+        missing_cmds, missing_mods, missing_optional = SetupWorker.detect_missing_requirements()
+        self.signals.done.emit(missing_cmds, missing_mods, missing_optional)
+
+
+class _DeviceProbeSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(list)
+
+
+class DeviceProbe(QtCore.QRunnable):
+    """Sucht SDR-Geräte im Thread-Pool, damit die Oberfläche nicht blockiert."""
+
+    def __init__(self, force: bool = False):
+        super().__init__()
+        # Der Thread-Pool löscht den Runnable nach run(); das Fenster hält nur die Signale
+        self.signals = _DeviceProbeSignals()
+        self._force = force
+
+    def run(self):
+        self.signals.done.emit(list_sdr_devices(self._force))
+
+
 class SDRScanner(QtCore.QObject):
     """Scannt einen Frequenzbereich mit rtl_power und sendet Spektrumsdaten."""
 
     spectrum_ready = QtCore.pyqtSignal(np.ndarray, np.ndarray)
     frequency_selected = QtCore.pyqtSignal(float)
 
+    READ_BUFFER = 1 << 20
+
     def __init__(self, device: str, ppm: int = 0, gain=None, parent=None):
         super().__init__(parent)
         self.device = device
@@ -1042,6 +1601,12 @@ class SDRScanner(QtCore.QObject):
         self._thread = None
         self._running = threading.Event()
         self._process = None
+        self._rng = np.random.default_rng()
+        # Frequenzachsen je (Start, Schrittweite, Bins); bleibt über Scanzyklen erhalten
+        self._freqs_cache = {}
+        # Frequenzachse und Rauschpuffer der Simulation, gültig für einen Bereich
+        self._sim_key = None
+        self._sim_arrays = None
 
     def start(self, f_start=380e6, f_end=430e6, bin_size=10e3):
         """Startet den Scan mit rtl_power."""
@@ -1074,51 +1639,281 @@ class SDRScanner(QtCore.QObject):
         if self.device_id is not None:
             cmd.extend(["-d", str(self.device_id)])
         try:
+            # Binärmodus ohne TextIOWrapper; großer Puffer, da eine rtl_power-Zeile
+            # bei feinen Bins mehrere hundert KiB lang wird
             self._process = subprocess.Popen(cmd, stdout=subprocess.PIPE,
                                              stderr=subprocess.DEVNULL,
-                                             text=True)
+                                             bufsize=self.READ_BUFFER)
         except FileNotFoundError:
             # rtl_power nicht gefunden, Daten simulieren
             self._simulate_scan(f_start, f_end, bin_size)
             return
 
-        while self._running.is_set():
-            line = self._process.stdout.readline()
-            if not line:
+        # Ein ganzer Sweep soll in den Pipe-Puffer passen
+        _enlarge_pipe(self._process.stdout.fileno(), self.READ_BUFFER)
+        freqs_cache = self._freqs_cache
+        for zeilen in _iter_line_blocks(self._process.stdout, self.READ_BUFFER):
+            if not self._running.is_set():
                 break
-            parts = line.strip().split(',')
-            if len(parts) < 6:
-                continue
-            try:
-                # rtl_power gibt Startfrequenz (parts[2]), Schrittweite (parts[4]) und Leistungswerte aus
-                f0 = float(parts[2])
-                bin_hz = float(parts[4])
-                powers = np.array(list(map(float, parts[6:])))
-            except ValueError:
-                continue
-            freqs = f0 + bin_hz * np.arange(len(powers))
-            self.spectrum_ready.emit(freqs, powers)
-            max_idx = np.argmax(powers)
-            self.frequency_selected.emit(freqs[max_idx])
+            # Nur die Kopffelder abtrennen, die Leistungswerte parst NumPy am Stück;
+            # split mit Grenze läuft nicht wie eine Regex über die ganze Zeile.
+            # Hinkt die GUI hinterher, liegen mehrere Sweeps im Block: je
+            # Teilbereich (Startfrequenz) zählt nur die neueste Zeile.
+            neueste = {}
+            for line in zeilen:
+                parts = line.split(b",", RTL_POWER_HEAD_FIELDS)
+                if len(parts) > RTL_POWER_HEAD_FIELDS:
+                    neueste[parts[2]] = parts
+            for parts in neueste.values():
+                self._emit_power_row(parts, freqs_cache)
 
         if self._process:
             self._process.terminate()
             self._process = None
 
+    def _emit_power_row(self, parts, freqs_cache):
+        """Parst eine zerlegte rtl_power-Zeile und sendet Spektrum und Spitze."""
+        powers = np.fromstring(parts[RTL_POWER_HEAD_FIELDS], sep=',', dtype=np.float32)
+        if len(powers) == 0:
+            return
+        # Schlüssel aus den Rohbytes: bei einem Treffer entfällt float() je Zeile
+        key = (parts[2], parts[4], len(powers))
+        freqs = freqs_cache.get(key)
+        if freqs is None:
+            try:
+                f0 = float(parts[2])
+                bin_hz = float(parts[4])
+            except ValueError:
+                return
+            if len(freqs_cache) >= 64:
+                freqs_cache.clear()
+            # Eine Allokation, Skalierung und Versatz in place
+            freqs = np.arange(len(powers), dtype=np.float64)
+            freqs *= bin_hz
+            freqs += f0
+            freqs.setflags(write=False)
+            freqs_cache[key] = freqs
+        self.spectrum_ready.emit(freqs, powers)
+        self.frequency_selected.emit(freqs[powers.argmax()])
+
     def _simulate_scan(self, f_start, f_end, bin_size):
-        freqs = np.arange(f_start, f_end, bin_size)
+        key = (f_start, f_end, bin_size)
+        if self._sim_key != key:
+            freqs = np.arange(f_start, f_end, bin_size)
+            freqs.setflags(write=False)
+            # Zwei wiederverwendete Puffer im Wechsel, damit die GUI nie einen Puffer
+            # sieht, der gerade neu beschrieben wird
+            puffer = [np.empty(len(freqs), dtype=np.float32) for _ in range(2)]
+            self._sim_key = key
+            self._sim_arrays = (freqs, puffer)
+        freqs, puffer = self._sim_arrays
+        i = 0
         while self._running.is_set():
-            noise = np.random.normal(-80, 5, size=len(freqs))
-            peak_idx = np.random.randint(0, len(freqs))
+            noise = puffer[i]
+            i ^= 1
+            self._rng.standard_normal(out=noise, dtype=np.float32)
+            np.multiply(noise, 5.0, out=noise)
+            np.add(noise, -80.0, out=noise)
+            peak_idx = int(self._rng.integers(len(freqs)))
             noise[peak_idx] += 20
             self.spectrum_ready.emit(freqs, noise)
             self.frequency_selected.emit(freqs[peak_idx])
             QtCore.QThread.sleep(1)
 
 
+# Liegt der Spitzenpegel schon innerhalb von ±1/AGC_BAND_DIV (5 %) um das Ziel,
+# bleibt der Block unverändert; spart den Skalierungsdurchlauf
+AGC_BAND_DIV = 20
+
+
+def _agc_int16(buf, target):
+    """AGC in einem Durchlauf: Spitzenwert suchen, in Q8 skalieren, sättigen."""
+    peak = 0
+    for i in range(len(buf)):
+        v = int(buf[i])
+        if v < 0:
+            v = -v
+        if v > peak:
+            peak = v
+    if peak > 0 and abs(peak - target) * AGC_BAND_DIV > target:
+        g = (target * 256) // peak
+        for i in range(len(buf)):
+            x = (int(buf[i]) * g) >> 8
+            if x > 32767:
+                x = 32767
+            elif x < -32768:
+                x = -32768
+            buf[i] = x
+    return peak
+
+
+def _agc_float32(src, dst, target):
+    """Gefilterten float32-Block sättigen, nach int16 schreiben und AGC anwenden."""
+    peak = 0
+    for i in range(len(src)):
+        v = src[i]
+        if v > 32767.0:
+            v = 32767.0
+        elif v < -32768.0:
+            v = -32768.0
+        x = int(v)
+        dst[i] = x
+        if x < 0:
+            x = -x
+        if x > peak:
+            peak = x
+    if peak > 0 and abs(peak - target) * AGC_BAND_DIV > target:
+        g = (target * 256) // peak
+        for i in range(len(dst)):
+            x = (int(dst[i]) * g) >> 8
+            if x > 32767:
+                x = 32767
+            elif x < -32768:
+                x = -32768
+            dst[i] = x
+    return peak
+
+
+# Mit Numba als kompilierter Kernel, ohne das Modul bleibt der NumPy-Pfad aktiv.
+# nogil gibt den GIL während der Schleifen frei, damit der GUI-Thread weiterläuft.
+_agc_int16_kernel = _agc_float32_kernel = None
+if njit is not None:
+    try:
+        _agc_int16_kernel = njit(cache=True, nogil=True, boundscheck=False)(_agc_int16)
+        _agc_float32_kernel = njit(cache=True, nogil=True, boundscheck=False)(_agc_float32)
+    except Exception:
+        _agc_int16_kernel = _agc_float32_kernel = None
+
+
+class WavWriter:
+    """Schreibt Mono-WAV-Daten (16 Bit) in einem eigenen Thread."""
+
+    # Abstand in Sekunden, nach dem die Längenangaben im WAV-Kopf aktualisiert werden
+    HEADER_PATCH_S = 5
+
+    def __init__(self, path: str, rate: int, flush_bytes: int, maxsize: int = 64):
+        self._wav = wave.open(path, "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(rate)
+        self._flush_bytes = flush_bytes
+        # Kopfzeile nur alle paar Sekunden nachtragen statt bei jedem Schreiben
+        self._patch_bytes = rate * 2 * self.HEADER_PATCH_S
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._ende = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, data):
+        if self._ende.is_set():
+            return
+        # Bei langsamem Speicher lieber Daten verwerfen als die Wiedergabe blockieren
+        try:
+            self._queue.put_nowait(bytes(data))
+        except queue.Full:
+            pass
+
+    def close(self, wait: bool = True):
+        """Beendet die Datei; mit wait=False nur an den Schreib-Thread übergeben."""
+        self._ende.set()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            # Volle Queue: der Schreib-Thread arbeitet sie ab und sieht danach _ende
+            pass
+        if wait:
+            self._thread.join()
+
+    def _run(self):
+        puffer = bytearray()
+        seit_kopf = 0
+        while True:
+            if self._ende.is_set() and self._queue.empty():
+                break
+            data = self._queue.get()
+            if data is None:
+                break
+            puffer += data
+            if len(puffer) >= self._flush_bytes:
+                seit_kopf += len(puffer)
+                if seit_kopf >= self._patch_bytes:
+                    # writeframes trägt die Längen im Kopf nach (seek + write + seek)
+                    self._wav.writeframes(puffer)
+                    seit_kopf = 0
+                else:
+                    self._wav.writeframesraw(puffer)
+                puffer.clear()
+        if puffer:
+            self._wav.writeframes(puffer)
+        self._wav.close()
+
+
+class SampleRing:
+    """Ringpuffer für int16-Samples zwischen genau einem Schreiber und einem Leser."""
+
+    def __init__(self, size: int):
+        self._buf = np.empty(size, dtype=np.int16)
+        self._size = size
+        # Fortlaufende Zähler; jeder wird nur von einer Seite geschrieben
+        self._w = 0
+        self._r = 0
+        self._ready = threading.Event()
+        self.closed = False
+
+    def write(self, samples) -> int:
+        """Schreibt so viele Samples wie Platz ist und gibt deren Anzahl zurück."""
+        n = min(len(samples), self._size - (self._w - self._r))
+        if n <= 0:
+            return 0
+        pos = self._w % self._size
+        erster = min(n, self._size - pos)
+        self._buf[pos:pos + erster] = samples[:erster]
+        if erster < n:
+            self._buf[:n - erster] = samples[erster:n]
+        self._w += n
+        self._ready.set()
+        return n
+
+    def peek(self, max_n: int, timeout: float):
+        """Liefert bis zu max_n Samples als schreibgeschützte Byte-Sicht ohne Kopie.
+
+        None, wenn nichts vorliegt. Der Bereich bleibt gültig, bis der Leser ihn
+        mit consume() freigibt.
+        """
+        if self.closed:
+            return None
+        n = self._w - self._r
+        if n == 0:
+            self._ready.clear()
+            n = self._w - self._r
+            if n == 0:
+                self._ready.wait(timeout)
+                n = self._w - self._r
+                if n == 0 or self.closed:
+                    return None
+        # Nur bis zum Pufferende lesen: zusammenhängend, kein Zusammenfügen am Umbruch
+        pos = self._r % self._size
+        n = min(n, max_n, self._size - pos)
+        return memoryview(self._buf[pos:pos + n]).cast("B").toreadonly()
+
+    def consume(self, n: int):
+        """Gibt n gelesene Samples für den Schreiber frei."""
+        self._r += n
+
+    def close(self):
+        self.closed = True
+        self._ready.set()
+
+
 class AudioPlayer(QtCore.QObject):
     """Empfängt Audio von rtl_fm und spielt es über PyAudio ab."""
 
+    # Nur bei Wechsel zwischen still und aktiv, nicht pro Block
+    activity_changed = QtCore.pyqtSignal(bool)
+
+    # Entspricht dem Pipe-Puffer des Betriebssystems
+    READ_BYTES = 65536
+
     def __init__(self, device: str, ppm: int = 0, gain=None, parent=None):
         super().__init__(parent)
         self.device = device
@@ -1127,14 +1922,47 @@ class AudioPlayer(QtCore.QObject):
         self.gain = gain
         self._process = None
         self._stream = None
-        self._pa = pyaudio.PyAudio()
+        self._ring = None
+        self._writer = None
+        self._pa = _lade_pyaudio().PyAudio()
         self.agc_level = 10000
+        # Schwelle in int16-Rohwerten, verglichen mit dem Pegel vor der AGC
         self.activity_threshold = 1000
-        self.record_file = None
-        self.record_last = 0
+        self._reader = None
+        # Aufnahme etwa alle 200 ms schreiben statt pro Block
+        self._rec_flush_len = 48000 * 2 // 5
+        # Bandpass 100 Hz bis 12 kHz (Gleichanteil und Rauschen oberhalb der Sprache entfernen)
+        self._sos = None
+        if butter is not None:
+            self._sos = butter(
+                2, [100, 12000], btype="bandpass", fs=48000, output="sos"
+            ).astype(np.float32)
+        self._agc_kernel = _agc_int16_kernel
+        self._agc_float_kernel = _agc_float32_kernel if self._sos is not None else None
+        # Kompiliert wird erst im Lese-Thread, nicht beim Aufbau des Hauptfensters
+        self._kernels_ready = False
+
+    def _warm_up_kernels(self):
+        """Kompiliert die Numba-Kernel einmal vor dem ersten Block; fällt sonst auf NumPy zurück."""
+        if self._kernels_ready:
+            return
+        self._kernels_ready = True
+        if self._agc_kernel is not None:
+            try:
+                self._agc_kernel(np.zeros(16, dtype=np.int16), self.agc_level)
+            except Exception:
+                self._agc_kernel = None
+        if self._agc_float_kernel is not None:
+            try:
+                self._agc_float_kernel(
+                    np.zeros(16, dtype=np.float32), np.zeros(16, dtype=np.int16), self.agc_level
+                )
+            except Exception:
+                self._agc_float_kernel = None
 
     def start(self, frequency):
-        self.stop()
+        # Nur rtl_fm und die Threads neu starten, der PyAudio-Stream bleibt offen
+        self._stop_playback()
         gain_value = _resolve_gain_value(self.gain)
         cmd = [
             "rtl_fm",
@@ -1148,73 +1976,171 @@ class AudioPlayer(QtCore.QObject):
             cmd.extend(["-d", str(self.device_id)])
         try:
             self._process = subprocess.Popen(cmd, stdout=subprocess.PIPE,
-                                             stderr=subprocess.DEVNULL)
+                                             stderr=subprocess.DEVNULL,
+                                             bufsize=self.READ_BYTES)
         except FileNotFoundError:
             return
 
-        self._stream = self._pa.open(format=pyaudio.paInt16,
-                                     channels=1,
-                                     rate=48000,
-                                     output=True,
-                                     frames_per_buffer=1024)
-
-        threading.Thread(target=self._play, daemon=True).start()
+        if self._stream is None:
+            self._stream = self._pa.open(format=pyaudio.paInt16,
+                                         channels=1,
+                                         rate=48000,
+                                         output=True,
+                                         frames_per_buffer=4096)
+        elif not self._stream.is_active():
+            self._stream.start_stream()
+
+        # Einlesen/AGC und blockierendes stream.write laufen in getrennten Threads
+        self._ring = SampleRing(48000 * 4)
+        self._writer = threading.Thread(
+            target=self._write_audio, args=(self._ring, self._stream), daemon=True
+        )
+        self._writer.start()
+        self._reader = threading.Thread(
+            target=self._play, args=(self._process, self._ring), daemon=True
+        )
+        self._reader.start()
 
-    def stop(self):
+    def _stop_playback(self):
         if self._process:
             self._process.terminate()
             self._process = None
-        if self._stream:
+        if self._ring:
+            self._ring.close()
+            self._ring = None
+        if self._writer:
+            if self._writer is not threading.current_thread():
+                self._writer.join(timeout=1)
+            self._writer = None
+
+    def stop(self):
+        self._stop_playback()
+        # Stream nur anhalten; Öffnen kostet Zeit und knackt im Ausgabegerät
+        if self._stream and self._stream.is_active():
             self._stream.stop_stream()
+
+    def close(self):
+        """Beendet die Wiedergabe und gibt Stream und PyAudio frei."""
+        self.stop()
+        # Der Lese-Thread schließt seine Aufnahme selbst; darauf kurz warten
+        if self._reader and self._reader is not threading.current_thread():
+            self._reader.join(timeout=2)
+        self._reader = None
+        if self._stream:
             self._stream.close()
             self._stream = None
-        if self.record_file:
-            self.record_file.close()
-            self.record_file = None
-
-    def _play(self):
-        if not self._process:
-            return
+        self._pa.terminate()
+
+    def _write_audio(self, ring, stream):
+        # Direkt aus dem Ring schreiben; ältere PyAudio-Versionen wollen echte Bytes
+        ohne_kopie = True
+        while not ring.closed:
+            view = ring.peek(4096, 0.1)
+            if view is None:
+                continue
+            try:
+                if ohne_kopie:
+                    try:
+                        stream.write(view)
+                    except TypeError:
+                        ohne_kopie = False
+                        stream.write(view.tobytes())
+                else:
+                    stream.write(view.tobytes())
+            except OSError:
+                break
+            finally:
+                ring.consume(len(view) // 2)
+                view.release()
+
+    def _play(self, proc, ring):
+        self._warm_up_kernels()
+        # Ein Puffersatz je Wiedergabe; readinto1 liefert, was die Pipe gerade hergibt
+        rx = bytearray(self.READ_BYTES)
+        rxmv = memoryview(rx)
+        samples = np.frombuffer(rx, dtype=np.int16)
+        work = np.empty(len(samples), dtype=np.int32)
+        # Filterzustand über Blockgrenzen hinweg mitführen
+        # Koeffizienten, Zustand und Eingang in float32, damit sosfilt in float32 rechnet
+        zi = np.zeros((len(self._sos), 2), dtype=np.float32) if self._sos is not None else None
+        fbuf = np.empty(len(samples), dtype=np.float32) if zi is not None else None
+        rest = 0
+        aktiv = False
+        # Aufnahme gehört allein diesem Lese-Thread; stop() kann sie nicht austauschen
+        aufnahme = None
+        zuletzt_aktiv = 0.0
         while True:
-            data = self._process.stdout.read(2048)
-            if not data:
+            n = proc.stdout.readinto1(rxmv[rest:])
+            if not n:
                 break
-            # AGC anwenden
-            audio = np.frombuffer(data, dtype=np.int16)
-            level = np.max(np.abs(audio))
-            if level > 0:
-                gain = self.agc_level / level
-                audio = (audio * gain).astype(np.int16)
-            hat_aktivitaet = np.max(np.abs(audio)) > self.activity_threshold
+            n += rest
+            rest = n % 2
+            n -= rest
+            # AGC in Festkomma (Q8) über einen int32-Puffer, Ergebnis zurück in die bytearray-Sicht
+            m = n // 2
+            audio = samples[:m]
+            level = None
+            if zi is not None and m:
+                np.copyto(fbuf[:m], audio)
+                gefiltert, zi = sosfilt(self._sos, fbuf[:m], zi=zi)
+                if self._agc_float_kernel is not None:
+                    # Sättigen, Rückwandlung und AGC in einem kompilierten Durchlauf
+                    level = int(self._agc_float_kernel(gefiltert, audio, self.agc_level))
+                else:
+                    np.clip(gefiltert, -32768, 32767, out=gefiltert)
+                    np.copyto(audio, gefiltert, casting="unsafe")
+            if level is None:
+                if self._agc_kernel is not None:
+                    level = int(self._agc_kernel(audio, self.agc_level))
+                else:
+                    # Spitzenbetrag aus Minimum und Maximum: zwei reine Lesedurchläufe
+                    # statt Betrag in einen Puffer schreiben; int() vermeidet den
+                    # Überlauf von -(-32768) in int16
+                    level = max(int(audio.max()), -int(audio.min())) if m else 0
+                    if level > 0 and abs(level - self.agc_level) * AGC_BAND_DIV > self.agc_level:
+                        acc = work[:m]
+                        np.multiply(
+                            audio, self.agc_level * 256 // level, out=acc, dtype=np.int32
+                        )
+                        np.right_shift(acc, 8, out=acc)
+                        np.clip(acc, -32768, 32767, out=acc)
+                        np.copyto(audio, acc, casting="unsafe")
+            # Nach der AGC liegt der Spitzenpegel immer bei agc_level, daher zählt der Rohpegel
+            hat_aktivitaet = level > self.activity_threshold
+            if hat_aktivitaet != aktiv:
+                aktiv = hat_aktivitaet
+                self.activity_changed.emit(aktiv)
             if hat_aktivitaet:
-                QtCore.QMetaObject.invokeMethod(
-                    self.parent(), "notify_activity", QtCore.Qt.QueuedConnection
-                )
-                self._start_recording()
-            self._write_recording(audio)
-            self._stream.write(audio.tobytes())
-
-        self.stop()
-
-    def _start_recording(self):
-        if self.record_file:
-            self.record_last = time.time()
-            return
+                zuletzt_aktiv = time.monotonic()
+                if aufnahme is None:
+                    aufnahme = self._open_recording()
+            if aufnahme is not None:
+                aufnahme.write(audio.data)
+                # Bei Aktivität wurde die Uhr eben gelesen; nur in Pausen erneut
+                if not hat_aktivitaet and time.monotonic() - zuletzt_aktiv > 2:
+                    # Abschluss dem Schreib-Thread überlassen, nicht hier auf die Platte warten
+                    aufnahme.close(wait=False)
+                    aufnahme = None
+            # Ist der Ring voll, gehen lieber Samples verloren als dass das Einlesen stockt
+            ring.write(audio)
+            if rest:
+                # Ungerades Byte an den Pufferanfang, damit die Samples ausgerichtet bleiben
+                rx[0] = rx[n]
+
+        if aktiv:
+            self.activity_changed.emit(False)
+        if aufnahme is not None:
+            # Wiedergabe ist vorbei, Warten auf den Abschluss stört hier nicht mehr
+            aufnahme.close()
+        # Ein inzwischen neu gestartetes rtl_fm nicht mit beenden
+        if self._process is proc:
+            self.stop()
+
+    def _open_recording(self):
         path = os.path.expanduser("~/TetraRecordings")
         os.makedirs(path, exist_ok=True)
         fname = datetime.now().strftime("rec_%Y%m%d_%H%M%S.wav")
-        self.record_file = wave.open(os.path.join(path, fname), "wb")
-        self.record_file.setnchannels(1)
-        self.record_file.setsampwidth(2)
-        self.record_file.setframerate(48000)
-        self.record_last = time.time()
-
-    def _write_recording(self, audio):
-        if self.record_file:
-            self.record_file.writeframes(audio.tobytes())
-            if time.time() - self.record_last > 2:
-                self.record_file.close()
-                self.record_file = None
+        return WavWriter(os.path.join(path, fname), 48000, self._rec_flush_len)
 
 
 class LEDIndicator(QtWidgets.QFrame):
@@ -1235,57 +2161,95 @@ class LEDIndicator(QtWidgets.QFrame):
 class DecodedAudioPlayer(QtCore.QObject):
     """Spielt dekodierte TETRA-Audioframes über PyAudio ab."""
 
+    # Etwa zwei Sekunden Sprache bei 8 kHz zwischen Dekoder und Soundkarte
+    RING_SAMPLES = 16384
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._pa = pyaudio.PyAudio()
+        self._pa = _lade_pyaudio().PyAudio()
         self._stream = None
+        self._ring = None
         self.record = False
         self._wav = None
+        self._wav_flush_len = 8000 * 2 // 5
 
     def start(self, record: bool = False):
         self.stop()
         self.record = record
+        # PortAudio holt die Daten im eigenen Thread ab; process() blockiert so nie
+        # den GUI-Thread, auch wenn die Soundkarte gerade nichts annimmt
+        self._ring = SampleRing(self.RING_SAMPLES)
         self._stream = self._pa.open(
             format=pyaudio.paInt16,
             channels=1,
             rate=8000,
             output=True,
-            frames_per_buffer=1024,
+            frames_per_buffer=512,
+            stream_callback=self._fill_output,
         )
+        self._stream.start_stream()
         if record:
             path = os.path.expanduser("~/TetraVoice")
             os.makedirs(path, exist_ok=True)
             name = datetime.now().strftime("voice_%Y%m%d_%H%M%S.wav")
-            self._wav = wave.open(os.path.join(path, name), "wb")
-            self._wav.setnchannels(1)
-            self._wav.setsampwidth(2)
-            self._wav.setframerate(8000)
+            self._wav = WavWriter(os.path.join(path, name), 8000, self._wav_flush_len)
 
     def stop(self):
         if self._stream:
             self._stream.stop_stream()
             self._stream.close()
             self._stream = None
+        if self._ring:
+            self._ring.close()
+            self._ring = None
         if self._wav:
             self._wav.close()
             self._wav = None
 
+    def _fill_output(self, in_data, frame_count, time_info, status):
+        """PortAudio-Callback: liefert frame_count Samples, fehlende als Stille."""
+        ring = self._ring
+        teile = []
+        fehlen = frame_count
+        while ring is not None and fehlen:
+            view = ring.peek(fehlen, 0)
+            if view is None:
+                break
+            teile.append(view.tobytes())
+            n = len(view) // 2
+            view.release()
+            ring.consume(n)
+            fehlen -= n
+        if fehlen:
+            teile.append(bytes(2 * fehlen))
+        return b"".join(teile), pyaudio.paContinue
+
     def process(self, data: bytes):
         if not self._stream:
             return
-        self._stream.write(data)
+        # Ist der Ring voll, gehen die neuesten Samples verloren statt zu blockieren
+        self._ring.write(np.frombuffer(data, dtype=np.int16))
         if self._wav:
-            self._wav.writeframes(data)
+            self._wav.write(data)
 
 
 class TetraDecoder(QtCore.QObject):
     """Startet osmocom-tetra-Werkzeuge und liefert dekodierte Ausgabe."""
 
     output = QtCore.pyqtSignal(str)
+    # Alle Zeilen eines Lesevorgangs von tetra-rx in einem Signal
+    lines = QtCore.pyqtSignal(list)
     audio = QtCore.pyqtSignal(bytes)
     encrypted = QtCore.pyqtSignal()
     finished = QtCore.pyqtSignal()
 
+    AUDIO_FRAME_BYTES = 320
+    AUDIO_READ_BYTES = 65536
+    # Abfrageintervall für die Audiodatei ohne FIFO: ein Frame (20 ms bei 8 kHz)
+    AUDIO_POLL_S = 0.02
+    OUTPUT_READ_BYTES = 65536
+    STAGE_PIPE_BYTES = 1 << 20
+
     def __init__(self, ppm: int = 0, parent=None):
         super().__init__(parent)
         self.ppm = ppm
@@ -1296,11 +2260,22 @@ class TetraDecoder(QtCore.QObject):
         self._audio_thread = None
         self._audio_path = None
         self._audio_mode = None
+        # Wecken FIFO-Leser und Ausgabe-Leser aus select(), sobald gestoppt wird (nur
+        # ohne Windows); je Leser eine eigene Pipe, jeder leert nur seine
+        self._wake_r = self._wake_w = None
+        self._out_wake_r = self._out_wake_w = None
+        if not sys.platform.startswith("win"):
+            self._wake_r, self._wake_w = os.pipe()
+            self._out_wake_r, self._out_wake_w = os.pipe()
+            for fd in (self._wake_r, self._wake_w, self._out_wake_r, self._out_wake_w):
+                os.set_blocking(fd, False)
 
     def start(self, frequency: float):
         """Startet die Dekodierkette für die angegebene Frequenz."""
         if self._thread and self._thread.is_alive():
             return
+        self._drain_wake_pipe(self._wake_r)
+        self._drain_wake_pipe(self._out_wake_r)
         self._running.set()
         self._thread = threading.Thread(target=self._run, args=(frequency,), daemon=True)
         self._thread.start()
@@ -1308,6 +2283,7 @@ class TetraDecoder(QtCore.QObject):
     def stop(self):
         """Stoppt die Dekodierung und beendet Kindprozesse."""
         self._running.clear()
+        self._wake_readers()
         self._terminate_processes()
         if (
             self._audio_thread
@@ -1325,6 +2301,25 @@ class TetraDecoder(QtCore.QObject):
         self._audio_thread = None
         self._cleanup_audio_file()
 
+    def _wake_readers(self):
+        for fd in (self._wake_w, self._out_wake_w):
+            if fd is None:
+                continue
+            try:
+                os.write(fd, b"x")
+            except OSError:
+                pass
+
+    @staticmethod
+    def _drain_wake_pipe(fd):
+        if fd is None:
+            return
+        try:
+            while os.read(fd, 64):
+                pass
+        except OSError:
+            pass
+
     def _cleanup_audio_file(self):
         if self._audio_path:
             try:
@@ -1334,15 +2329,49 @@ class TetraDecoder(QtCore.QObject):
             self._audio_path = None
             self._audio_mode = None
 
+    @staticmethod
+    def _group_kwargs(pgid):
+        """Popen-Argumente, damit die Dekodierkette eine gemeinsame Prozessgruppe bildet."""
+        if not _HAS_KILLPG:
+            return {}
+        # Neue Gruppe, aber in der eigenen Sitzung: setpgid() in eine Gruppe einer
+        # fremden Sitzung (start_new_session) scheitert mit EPERM
+        if pgid is None:
+            if sys.version_info >= (3, 11):
+                return {"process_group": 0}
+            return {"preexec_fn": os.setpgrp}
+        if sys.version_info >= (3, 11):
+            return {"process_group": pgid}
+        return {"preexec_fn": functools.partial(os.setpgid, 0, pgid)}
+
     def _terminate_processes(self):
+        gruppen = set()
         for proc in self._procs:
-            if proc and proc.poll() is None:
+            if not proc or proc.poll() is not None:
+                continue
+            pgid = None
+            if _HAS_KILLPG:
+                try:
+                    pgid = os.getpgid(proc.pid)
+                except OSError:
+                    pgid = None
+            # Nie die eigene Prozessgruppe signalisieren
+            if pgid is not None and pgid != os.getpgrp():
+                gruppen.add(pgid)
+            else:
                 proc.terminate()
+        for pgid in gruppen:
+            try:
+                os.killpg(pgid, signal.SIGTERM)
+            except OSError:
+                pass
+        # Gemeinsame Frist statt bis zu einer Sekunde pro Prozess
+        frist = time.monotonic() + 1
         for proc in self._procs:
             if not proc:
                 continue
             try:
-                proc.wait(timeout=1)
+                proc.wait(timeout=max(0.0, frist - time.monotonic()))
             except Exception:
                 pass
         self._procs = []
@@ -1375,9 +2404,9 @@ class TetraDecoder(QtCore.QObject):
                     f"Audioausgabe aktiviert ({self._audio_mode}), Pfad: {self._audio_path}"
                 )
 
-            if shutil.which("demod_float"):
+            if _which("demod_float"):
                 demod_cmd = ["demod_float"]
-            elif shutil.which("float_to_bits"):
+            elif _which("float_to_bits"):
                 demod_cmd = ["float_to_bits"]
             else:
                 demod_cmd = ["demod_float"]
@@ -1388,34 +2417,46 @@ class TetraDecoder(QtCore.QObject):
                 ["tetra-rx"] + (["-a", self._audio_path] if audio_enabled else []),
             ]
 
-            # Prüfen, ob alle Befehle vor dem Start vorhanden sind
+            # Prüfen, ob alle Befehle vor dem Start vorhanden sind, und die
+            # zwischengespeicherten Pfade direkt verwenden (kein erneutes PATH-Durchsuchen)
             for cmd in cmds:
-                if not shutil.which(cmd[0]):
+                pfad = _which(cmd[0])
+                if not pfad:
+                    # Beim nächsten Start neu suchen, falls inzwischen installiert
+                    _which.cache_clear()
                     self.output.emit(f"{cmd[0]} nicht im PATH gefunden")
                     self._running.clear()
                     self.finished.emit()
                     return
+                cmd[0] = pfad
+            # Fehlerausgaben nur mitlesen, wenn ein Selector alle Pipes bedienen kann
+            diag = subprocess.PIPE if self._wake_r is not None else subprocess.DEVNULL
             p1 = subprocess.Popen(
                 cmds[0],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
+                stderr=diag,
+                **self._group_kwargs(None),
             )
             self._procs.append(p1)
+            # Große Kernel-Puffer zwischen den Stufen: weniger Kontextwechsel, und eine
+            # kurz stockende Stufe hält die vorherige nicht sofort an
+            _enlarge_pipe(p1.stdout.fileno(), self.STAGE_PIPE_BYTES)
             p2 = subprocess.Popen(
                 cmds[1],
                 stdin=p1.stdout,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
+                stderr=diag,
+                **self._group_kwargs(p1.pid),
             )
             self._procs.append(p2)
             p1.stdout.close()
+            _enlarge_pipe(p2.stdout.fileno(), self.STAGE_PIPE_BYTES)
             p3 = subprocess.Popen(
                 cmds[2],
                 stdin=p2.stdout,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                **self._group_kwargs(p1.pid),
             )
             p2.stdout.close()
             self._procs.append(p3)
@@ -1424,17 +2465,21 @@ class TetraDecoder(QtCore.QObject):
                 self._audio_thread.start()
 
             if p3 and p3.stdout:
-                for line in p3.stdout:
-                    if not self._running.is_set():
-                        break
-                    txt = line.rstrip()
-                    self.output.emit(txt)
-                    if "CACH" in txt or "LIP" in txt:
-                        self.encrypted.emit()
+                if self._wake_r is not None:
+                    self._read_pipes(
+                        p3.stdout,
+                        [(cmds[0][0], p1.stderr), (cmds[1][0], p2.stderr)],
+                    )
+                else:
+                    self._read_output(p3.stdout)
         except Exception as exc:
+            if isinstance(exc, OSError):
+                # Zwischengespeicherter Pfad ist womöglich veraltet
+                _which.cache_clear()
             self.output.emit(f"Decoder konnte nicht gestartet werden: {exc}")
         finally:
             self._running.clear()
+            self._wake_readers()
             self._terminate_processes()
             if (
                 self._audio_thread
@@ -1446,37 +2491,90 @@ class TetraDecoder(QtCore.QObject):
             self._cleanup_audio_file()
             self.finished.emit()
 
+    def _emit_block(self, daten: bytes):
+        """Meldet einen Block vollständiger Zeilen (ohne abschließenden Umbruch)."""
+        # Einmal für den ganzen Block dekodieren; 0x0A kommt in UTF-8 nie innerhalb
+        # eines Mehrbytezeichens vor, die Zeilen bleiben also dieselben
+        self.lines.emit([z.rstrip() for z in daten.decode("utf-8", "replace").split("\n")])
+        # Eine Suche über den ganzen Block statt einer je Zeile; ein Hinweis je Block genügt
+        if _ENCRYPTED_RE.search(daten):
+            self.encrypted.emit()
+
+    def _read_pipes(self, stdout, diagnose):
+        """Bedient tetra-rx-Ausgabe und Fehlerausgaben der Vorstufen in einem Thread."""
+        _enlarge_pipe(stdout.fileno(), 1 << 20)
+        sel = selectors.DefaultSelector()
+        sel.register(stdout.fileno(), selectors.EVENT_READ, "")
+        for name, pipe in diagnose:
+            if pipe is not None:
+                os.set_blocking(pipe.fileno(), False)
+                sel.register(pipe.fileno(), selectors.EVENT_READ, os.path.basename(name))
+        os.set_blocking(stdout.fileno(), False)
+        # Eigene Weck-Pipe; wird hier geleert, sonst meldet select() sie endlos bereit
+        sel.register(self._out_wake_r, selectors.EVENT_READ, None)
+        reste = {}
+        try:
+            while self._running.is_set():
+                for key, _ in sel.select():
+                    if key.data is None:
+                        self._drain_wake_pipe(self._out_wake_r)
+                        continue
+                    try:
+                        block = os.read(key.fd, self.OUTPUT_READ_BYTES)
+                    except BlockingIOError:
+                        continue
+                    if not block:
+                        sel.unregister(key.fd)
+                        if key.data == "":
+                            rest = reste.get(key.fd)
+                            if rest and self._running.is_set():
+                                self._emit_block(rest)
+                            return
+                        continue
+                    daten = reste.get(key.fd, b"") + block
+                    ende = daten.rfind(b"\n")
+                    if ende < 0:
+                        reste[key.fd] = daten
+                        continue
+                    reste[key.fd] = daten[ende + 1 :]
+                    if key.data == "":
+                        self._emit_block(daten[:ende])
+                    else:
+                        for z in daten[:ende].split(b"\n"):
+                            logger.info(f"{key.data}: {z.decode('utf-8', 'replace').rstrip()}")
+        finally:
+            sel.close()
+            for _, pipe in diagnose:
+                if pipe is not None:
+                    pipe.close()
+
+    def _read_output(self, stream):
+        """Liest tetra-rx blockweise und meldet alle vollständigen Zeilen gesammelt."""
+        _enlarge_pipe(stream.fileno(), 1 << 20)
+        rest = b""
+        while self._running.is_set():
+            block = stream.read1(self.OUTPUT_READ_BYTES)
+            if not block or not self._running.is_set():
+                break
+            daten = rest + block
+            ende = daten.rfind(b"\n")
+            if ende < 0:
+                rest = daten
+                continue
+            rest = daten[ende + 1 :]
+            self._emit_block(daten[:ende])
+        if rest and self._running.is_set():
+            self._emit_block(rest)
+
     def _read_audio(self):
         try:
             while self._running.is_set():
                 try:
                     if self._audio_mode == "fifo":
-                        with open(self._audio_path, "rb", buffering=0) as fh:
-                            while self._running.is_set():
-                                data = fh.read(320)
-                                if not data:
-                                    time.sleep(0.05)
-                                    break
-                                self.audio.emit(data)
+                        self._read_fifo()
+                        time.sleep(0.05)
                     elif self._audio_mode == "file":
-                        with open(self._audio_path, "rb", buffering=0) as fh:
-                            pos = 0
-                            while self._running.is_set():
-                                try:
-                                    size = os.path.getsize(self._audio_path)
-                                except OSError:
-                                    time.sleep(0.05)
-                                    continue
-                                if size - pos < 320:
-                                    time.sleep(0.05)
-                                    continue
-                                fh.seek(pos)
-                                data = fh.read(320)
-                                pos = fh.tell()
-                                if data:
-                                    self.audio.emit(data)
-                                else:
-                                    time.sleep(0.05)
+                        self._read_file()
                     else:
                         time.sleep(0.05)
                 except Exception:
@@ -1484,6 +2582,58 @@ class TetraDecoder(QtCore.QObject):
         finally:
             self._cleanup_audio_file()
 
+    def _read_file(self):
+        """Folgt der wachsenden Audiodatei (Windows) und sendet ganze Frames gebündelt."""
+        mv = memoryview(bytearray(self.AUDIO_READ_BYTES))
+        rest = 0
+        try:
+            with open(self._audio_path, "rb", buffering=0) as fh:
+                while self._running.is_set():
+                    # Am Dateiende liefert readinto 0, ohne stat() und seek() je Frame
+                    n = fh.readinto(mv[rest:])
+                    if not n:
+                        # Nur ohne neue Daten warten, höchstens eine Framedauer
+                        time.sleep(self.AUDIO_POLL_S)
+                        continue
+                    gesamt = rest + n
+                    nutzbar = gesamt - gesamt % self.AUDIO_FRAME_BYTES
+                    if nutzbar:
+                        self.audio.emit(bytes(mv[:nutzbar]))
+                    rest = gesamt - nutzbar
+                    if rest and nutzbar:
+                        mv[:rest] = mv[nutzbar:gesamt]
+        finally:
+            mv.release()
+
+    def _read_fifo(self):
+        """Liest die Audio-FIFO blockweise und sendet ganze Frames gebündelt."""
+        # O_NONBLOCK, damit open() nicht bis zum ersten Schreiber blockiert
+        fd = os.open(self._audio_path, os.O_RDONLY | os.O_NONBLOCK)
+        mv = memoryview(bytearray(self.AUDIO_READ_BYTES))
+        rest = 0
+        try:
+            while self._running.is_set():
+                bereit, _, _ = select.select([fd, self._wake_r], [], [])
+                if self._wake_r in bereit:
+                    self._drain_wake_pipe(self._wake_r)
+                    continue
+                try:
+                    n = os.readv(fd, [mv[rest:]])
+                except BlockingIOError:
+                    continue
+                if not n:
+                    break
+                gesamt = rest + n
+                nutzbar = gesamt - gesamt % self.AUDIO_FRAME_BYTES
+                if nutzbar:
+                    self.audio.emit(bytes(mv[:nutzbar]))
+                rest = gesamt - nutzbar
+                if rest and nutzbar:
+                    mv[:rest] = mv[nutzbar:gesamt]
+        finally:
+            mv.release()
+            os.close(fd)
+
 
 class SpectrumCanvas(FigureCanvas):
     """Matplotlib-Canvas für die Spektrumsanzeige."""
@@ -1494,18 +2644,262 @@ class SpectrumCanvas(FigureCanvas):
         self.ax = self.fig.add_subplot(111)
         self.ax.set_xlabel("Frequenz [Hz]")
         self.ax.set_ylabel("Leistung [dB]")
-        self.line, = self.ax.plot([], [])
+        # Linie wird per Blitting über den gesicherten Hintergrund gezeichnet
+        self.line, = self.ax.plot([], [], animated=True)
+        self._bg = None
+        self._span = None
+        self.mpl_connect("draw_event", self._cache_background)
+
+    def _cache_background(self, event=None):
+        self._bg = self.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
 
     def update_spectrum(self, freqs, powers):
         self.line.set_data(freqs, powers)
-        self.ax.relim()
-        self.ax.autoscale_view()
-        self.draw()
+        span = (float(freqs[0]), float(freqs[-1])) if len(freqs) else None
+        y_min, y_max = self.ax.get_ylim()
+        if len(powers):
+            lo, hi = float(np.nanmin(powers)), float(np.nanmax(powers))
+        else:
+            lo, hi = y_min, y_max
+        if self._bg is None or span != self._span or lo < y_min or hi > y_max:
+            # Nur bei neuem Bereich Achsen neu berechnen und komplett zeichnen
+            self._span = span
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self.draw_idle()
+            return
+        self.restore_region(self._bg)
+        self.ax.draw_artist(self.line)
+        self.blit(self.ax.bbox)
+
+    def save_png(self, path: str):
+        # savefig lässt animierte Artists weg
+        self.line.set_animated(False)
+        try:
+            self.fig.savefig(path)
+        finally:
+            self.line.set_animated(True)
+
+
+if pg is not None:
+
+    class SpectrumPlot(pg.PlotWidget):
+        """PyQtGraph-Widget für die Spektrumsanzeige (schneller als Matplotlib)."""
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.setLabel("bottom", "Frequenz [Hz]")
+            self.setLabel("left", "Leistung [dB]")
+            self.curve = self.plot([], [], pen="y")
+            # Breite Sweeps nur mit so vielen Punkten zeichnen, wie Pixel sichtbar sind
+            self.setDownsampling(auto=True, mode="peak")
+            self.setClipToView(True)
+            # Achsen nur bei geändertem Frequenzbereich neu skalieren
+            self.enableAutoRange(enable=False)
+            self._span = None
+
+        def update_spectrum(self, freqs, powers):
+            self.curve.setData(freqs, powers)
+            span = (float(freqs[0]), float(freqs[-1])) if len(freqs) else None
+            if span != self._span:
+                self._span = span
+                self.autoRange()
+                return
+            # Wie bei Matplotlib nur neu skalieren, wenn Pegel den sichtbaren Bereich verlassen
+            if len(powers):
+                y_min, y_max = self.viewRange()[1]
+                if float(np.nanmin(powers)) < y_min or float(np.nanmax(powers)) > y_max:
+                    self.autoRange()
+
+        def save_png(self, path: str):
+            pg.exporters.ImageExporter(self.plotItem).export(path)
+
+
+class LineParser(QtCore.QObject):
+    """Filtert und zerlegt Dekoderzeilen in einem eigenen Thread."""
+
+    # Zeile, Zellfelder (cell, lac, mcc, mnc) oder None, Pakettyp oder "", Sprechgruppen
+    parsed = QtCore.pyqtSignal(str, object, str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Werden vom GUI-Thread als Ganzes ersetzt, nie verändert
+        self.filter_re = None
+        # (Auswahl, Vorprüfungstupel) zusammen, damit beide immer zusammenpassen
+        self.selection = (frozenset(), None)
+
+    @QtCore.pyqtSlot(str)
+    def parse(self, line: str):
+        filter_re = self.filter_re
+        if filter_re is not None and not filter_re.search(line):
+            return
+        klein = line.lower()
+        selected, texte = self.selection
+        if not mentions_talkgroup(line, klein, texte):
+            return
+        ids = extract_talkgroup_ids(line, klein)
+        if selected and selected.isdisjoint(ids):
+            return
+        cell = match_cell_info(line, klein)
+        packet = packet_type(line)
+        self.parsed.emit(line, cell, packet, ids)
+
+    @QtCore.pyqtSlot(list)
+    def parse_lines(self, lines: list):
+        for line in lines:
+            self.parse(line)
+
+
+class CellModel(QtCore.QAbstractTableModel):
+    """Tabellenmodell für erkannte Zellen."""
+
+    HEADERS = ["Zell-ID", "LAC", "MCC", "MNC", "Frequenz"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._index = {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        return str(self._rows[index.row()].get(CELL_FIELDS[index.column()], ""))
+
+    def upsert(self, cell: dict):
+        """Fügt eine Zelle hinzu oder aktualisiert nur deren Zeile."""
+        cid = cell["cell"]
+        row = self._index.get(cid)
+        if row is None:
+            row = len(self._rows)
+            self.beginInsertRows(QtCore.QModelIndex(), row, row)
+            self._rows.append(cell)
+            self._index[cid] = row
+            self.endInsertRows()
+        else:
+            self._rows[row] = cell
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def remove(self, cids):
+        """Entfernt mehrere Zellen und baut den Zeilenindex nur einmal nach."""
+        rows = sorted((self._index.pop(cid) for cid in cids if cid in self._index), reverse=True)
+        if not rows:
+            return
+        wurzel = QtCore.QModelIndex()
+        # Von hinten löschen, damit die übrigen Zeilennummern gültig bleiben
+        for row in rows:
+            self.beginRemoveRows(wurzel, row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+        for pos in range(rows[-1], len(self._rows)):
+            self._index[self._rows[pos]["cell"]] = pos
+
+
+class TalkgroupModel(QtCore.QAbstractTableModel):
+    """Tabellenmodell für Sprechgruppen, zuletzt aktive zuerst."""
+
+    HEADERS = ["Auswahl", "TG-ID", "Treffer", "Letzte Aktivität"]
+
+    selection_changed = QtCore.pyqtSignal(str, bool)
+
+    def __init__(self, talkgroups: OrderedDict, selected: set, parent=None):
+        super().__init__(parent)
+        self._talkgroups = talkgroups
+        self._selected = selected
+        self._rows = []
+        self.refresh()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        tg_id = self._rows[index.row()]
+        col = index.column()
+        if col == 0:
+            if role == QtCore.Qt.CheckStateRole:
+                return QtCore.Qt.Checked if tg_id in self._selected else QtCore.Qt.Unchecked
+            return None
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if col == 1:
+            return tg_id
+        info = self._talkgroups.get(tg_id, {})
+        if col == 2:
+            return str(info.get("count", 0))
+        return info.get("last_seen_str", "")
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 0:
+            flags |= QtCore.Qt.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or index.column() != 0 or role != QtCore.Qt.CheckStateRole:
+            return False
+        tg_id = self._rows[index.row()]
+        self.selection_changed.emit(tg_id, value == QtCore.Qt.Checked)
+        self.dataChanged.emit(index, index, [QtCore.Qt.CheckStateRole])
+        return True
+
+    def set_selected(self, selected: set):
+        self._selected = selected
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, 0), [QtCore.Qt.CheckStateRole]
+            )
+
+    def refresh(self):
+        """Übernimmt alle Zeilen in der Reihenfolge des Sprechgruppen-Dicts."""
+        self.beginResetModel()
+        # Schlüssel sind bereits Zeichenketten (beim Laden und Parsen normalisiert)
+        self._rows = list(self._talkgroups)
+        self.endResetModel()
+
+    def touch(self, tg_ids):
+        """Zieht gerade aktive Sprechgruppen nach oben, ohne die Tabelle neu aufzubauen."""
+        wurzel = QtCore.QModelIndex()
+        for tg_id in tg_ids:
+            try:
+                row = self._rows.index(tg_id)
+            except ValueError:
+                self.beginInsertRows(wurzel, 0, 0)
+                self._rows.insert(0, tg_id)
+                self.endInsertRows()
+                continue
+            if row > 0:
+                self.beginMoveRows(wurzel, row, row, wurzel, 0)
+                self._rows.insert(0, self._rows.pop(row))
+                self.endMoveRows()
+            self.dataChanged.emit(self.index(0, 2), self.index(0, 3))
 
 
 class MainWindow(QtWidgets.QMainWindow):
     """Hauptfenster der Anwendung."""
 
+    _QDARK_SS = None
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("SDR-Scanner")
@@ -1513,23 +2907,26 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Widgets, die in mehreren Tabs verwendet werden
         self.start_btn = QtWidgets.QPushButton(
-            QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay),
+            _std_icon(QtWidgets.QStyle.SP_MediaPlay),
             "Starten",
         )
         self.stop_btn = QtWidgets.QPushButton(
-            QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_MediaStop),
+            _std_icon(QtWidgets.QStyle.SP_MediaStop),
             "Stopp",
         )
         self.freq_label = QtWidgets.QLabel("Frequenz: k. A.")
 
-        self.canvas = SpectrumCanvas()
+        self.canvas = SpectrumPlot() if pg is not None else SpectrumCanvas()
         self.log = QtWidgets.QPlainTextEdit()
         self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(MAX_OUTPUT_LINES)
+        self.log.setUndoRedoEnabled(False)
         self.freq_list = QtWidgets.QListWidget()
 
         self.activity_led = LEDIndicator()
 
         self.device_box = QtWidgets.QComboBox()
+        self._device_probe_signals = None
         self.refresh_devices()
 
         self.freq_range_box = QtWidgets.QComboBox()
@@ -1579,12 +2976,53 @@ class MainWindow(QtWidgets.QMainWindow):
             gain=self.config.get("gain", "max"),
             parent=self,
         )
+        self._activity_timer = QtCore.QTimer(self)
+        self._activity_timer.setSingleShot(True)
+        self._activity_timer.setInterval(500)
+        self._activity_timer.timeout.connect(lambda: self.activity_led.set_color("green"))
+        self.player.activity_changed.connect(self.notify_activity)
         self.decoder = TetraDecoder(ppm=self.config.get("ppm", 0), parent=self)
         self.dec_audio_player = DecodedAudioPlayer(parent=self)
+        self._line_parser = LineParser()
+        self._parser_thread = QtCore.QThread(self)
+        self._line_parser.moveToThread(self._parser_thread)
+        self._parser_thread.start()
 
         self.scheduler_timer = QtCore.QTimer(self)
         self.scheduler_timer.timeout.connect(self.run_scheduled_cycle)
-
+        self._sched_applied = None
+        self._decode_timer = QtCore.QTimer(self)
+        self._decode_timer.setSingleShot(True)
+        self._decode_timer.timeout.connect(self._run_decode_phase)
+        self._stop_timer = QtCore.QTimer(self)
+        self._stop_timer.setSingleShot(True)
+        self._stop_timer.timeout.connect(self.stop)
+        # Spektren sammeln und höchstens alle 100 ms zeichnen (neuestes gewinnt)
+        self._latest_spectrum = None
+        self._spectrum_timer = QtCore.QTimer(self)
+        self._spectrum_timer.setSingleShot(True)
+        self._spectrum_timer.setInterval(100)
+        self._spectrum_timer.timeout.connect(self._draw_latest_spectrum)
+        self._pending_save = QtCore.QTimer(self)
+        self._pending_save.setSingleShot(True)
+        self._pending_save.setInterval(500)
+        self._pending_save.timeout.connect(self._save_config)
+        # Sprechgruppenauswahl erst beim verzögerten Speichern in die Konfiguration übernehmen
+        self._selection_dirty = False
+        self._telegram = TelegramSender()
+        # Statistik-, Talkgroup-, Zellen- und Dekoderansicht gesammelt alle 200 ms auffrischen
+        self._ui_dirty = set()
+        self._pending_tetra = []
+        # Geordnete Menge: jede Sprechgruppe nur einmal je Flush, zuletzt aktive hinten
+        self._pending_tg_ids = {}
+        self._pending_cells = {}
+        self._evicted_cells = []
+        self._ui_timer = QtCore.QTimer(self)
+        self._ui_timer.setSingleShot(True)
+        self._ui_timer.setInterval(200)
+        self._ui_timer.timeout.connect(self._flush_ui)
+
+        self._applied_theme = "light"
         if self.config.get("theme") == "dark":
             self.apply_theme("dark")
 
@@ -1595,11 +3033,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.start_btn.clicked.connect(self.start)
         self.stop_btn.clicked.connect(self.stop)
         self.freq_list.itemDoubleClicked.connect(self._select_frequency_from_list)
-        self.scanner.spectrum_ready.connect(self.canvas.update_spectrum)
+        self.scanner.spectrum_ready.connect(self._queue_spectrum)
         self.scanner.spectrum_ready.connect(self._update_scan_results)
         self.scanner.frequency_selected.connect(self.update_frequency)
 
-        self.decoder.output.connect(self._append_tetra)
+        # Regex-Auswertung läuft im Parser-Thread, hier kommen nur Ergebnisse an
+        self.decoder.output.connect(self._line_parser.parse)
+        self.decoder.lines.connect(self._line_parser.parse_lines)
+        self._line_parser.parsed.connect(self._handle_parsed_line)
         self.decoder.finished.connect(self._decoder_finished)
         self.decoder.audio.connect(self.dec_audio_player.process)
         self.decoder.encrypted.connect(self._encrypted_signal)
@@ -1612,8 +3053,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.scheduler_enable_cb.toggled.connect(self.update_scheduler)
         self.scheduler_interval_spin.valueChanged.connect(self.update_scheduler)
         self.export_cells_btn.clicked.connect(self.export_cells_csv)
-        self.token_edit.textChanged.connect(lambda t: self.config.__setitem__("telegram_token", t))
-        self.chat_edit.textChanged.connect(lambda t: self.config.__setitem__("telegram_chat", t))
+        self.token_edit.textChanged.connect(lambda t: self._set_config_value("telegram_token", t))
+        self.chat_edit.textChanged.connect(lambda t: self._set_config_value("telegram_chat", t))
         self.talkgroup_select_all_btn.clicked.connect(
             lambda: self._set_all_talkgroup_selection(True)
         )
@@ -1624,20 +3065,54 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_ppm(self.ppm_spin.value())
 
         self.freq_history = deque(maxlen=10)
-        self.scan_results = {}
+        self._last_scan_freq = None
+        self._pending_freq = None
+        self._freq_timer = QtCore.QTimer(self)
+        self._freq_timer.setSingleShot(True)
+        self._freq_timer.setInterval(500)
+        self._freq_timer.timeout.connect(self._apply_pending_frequency)
+        self._scan_range = None
+        self._reset_scan_results()
         self.current_frequency = None
-        self.cells = {}
-        self.packet_counts = {}
-        self.talkgroups = {}
+        self.cells = OrderedDict()
+        self._cells_max = MAX_CELLS
+        # Feste Reihenfolge hält die Balkenpositionen im Diagramm stabil
+        self._bar_keys = list(PACKET_TYPES)
+        self.packet_counts = {t: 0 for t in self._bar_keys}
+        # Reihenfolge = zuletzt aktiv zuerst
+        self.talkgroups = OrderedDict()
         self.selected_talkgroups = set()
         self._load_talkgroups_from_config()
         self._load_selected_talkgroups_from_config()
-        self._update_talkgroups_table()
-
-        self.talkgroup_table.itemChanged.connect(self._handle_talkgroup_selection_change)
+        self._sync_parser_selection()
+        self.talkgroup_model = TalkgroupModel(self.talkgroups, self.selected_talkgroups, self)
+        self.talkgroup_table.setModel(self.talkgroup_model)
+        header = self.talkgroup_table.horizontalHeader()
+        header.setStretchLastSection(True)
+        # Breiten einmal nach dem Befüllen bestimmen; ResizeToContents würde
+        # bei jeder Modelländerung alle Zeilen neu vermessen
+        for col in (0, 1, 2):
+            header.setSectionResizeMode(col, QtWidgets.QHeaderView.Interactive)
+            self.talkgroup_table.resizeColumnToContents(col)
+
+        self.talkgroup_model.selection_changed.connect(self._handle_talkgroup_selection_change)
 
         self.setup_worker = None
-        missing_cmds, missing_mods, missing_optional = SetupWorker.detect_missing_requirements()
+        self._requirement_signals = None
+        if SetupWorker.setup_recently_done():
+            self._handle_missing_requirements([], [], [])
+        else:
+            # Prüfung im Thread-Pool, damit das Fenster sofort erscheint
+            self.log.appendPlainText("Pr\u00fcfe Zusatzprogramme...")
+            check = RequirementCheck()
+            self._requirement_signals = check.signals
+            check.signals.done.connect(self._handle_missing_requirements)
+            QtCore.QThreadPool.globalInstance().start(check)
+
+    @QtCore.pyqtSlot(list, list, list)
+    def _handle_missing_requirements(self, missing_cmds, missing_mods, missing_optional):
+        """Wertet das Ergebnis der Abhängigkeitsprüfung aus und startet ggf. das Setup."""
+        self._requirement_signals = None
         if missing_cmds or missing_mods or missing_optional:
             self.log.appendPlainText("Starte automatische Pr\u00fcfung der Zusatzprogramme...")
             if missing_cmds:
@@ -1665,6 +3140,21 @@ class MainWindow(QtWidgets.QMainWindow):
                 "Alle ben\u00f6tigten Zusatzprogramme wurden bereits gefunden."
             )
 
+    @property
+    def current_frequency(self):
+        return self._current_frequency
+
+    @current_frequency.setter
+    def current_frequency(self, value):
+        # MHz-Texte nur bei Frequenzwechsel neu formatieren, nicht pro Zeile
+        self._current_frequency = value
+        if value is None:
+            self._freq_mhz3 = ""
+            self._freq_mhz4 = ""
+        else:
+            self._freq_mhz3 = f"{value/1e6:.3f}"
+            self._freq_mhz4 = f"{value/1e6:.4f}"
+
     def _build_tabs(self):
         """Erstellt die Haupt-Tabs inklusive TETRA-Dekodierung."""
         # Tab 1: Spektrum & Steuerung
@@ -1707,7 +3197,8 @@ class MainWindow(QtWidgets.QMainWindow):
         dev_layout = QtWidgets.QHBoxLayout()
         dev_layout.addWidget(self.device_box)
         refresh = QtWidgets.QPushButton("Neu suchen")
-        refresh.clicked.connect(self.refresh_devices)
+        # Ausdrücklich angeforderte Suche soll gerade eingesteckte Geräte finden
+        refresh.clicked.connect(lambda: self.refresh_devices(force=True))
         dev_layout.addWidget(refresh)
         f3.addRow("Ger\u00e4t:", dev_layout)
         f3.addRow("Frequenzbereich:", self.freq_range_box)
@@ -1749,12 +3240,12 @@ class MainWindow(QtWidgets.QMainWindow):
         v4 = QtWidgets.QVBoxLayout(tab4)
         ctl4 = QtWidgets.QHBoxLayout()
         self.tetra_start_btn = QtWidgets.QPushButton(
-            QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay),
+            _std_icon(QtWidgets.QStyle.SP_MediaPlay),
             "Dekodierung starten",
         )
         self.tetra_start_btn.setEnabled(False)
         self.tetra_stop_btn = QtWidgets.QPushButton(
-            QtWidgets.QApplication.style().standardIcon(QtWidgets.QStyle.SP_MediaStop),
+            _std_icon(QtWidgets.QStyle.SP_MediaStop),
             "Stopp",
         )
         self.tetra_stop_btn.setEnabled(False)
@@ -1766,18 +3257,20 @@ class MainWindow(QtWidgets.QMainWindow):
         v4.addLayout(ctl4)
         self.filter_edit = QtWidgets.QLineEdit()
         self.filter_edit.setPlaceholderText("Regex-Filter")
+        self.filter_edit.textChanged.connect(self._update_filter_re)
         v4.addWidget(self.filter_edit)
         self.tetra_output = QtWidgets.QPlainTextEdit()
         self.tetra_output.setReadOnly(True)
+        self.tetra_output.setMaximumBlockCount(MAX_OUTPUT_LINES)
+        self.tetra_output.setUndoRedoEnabled(False)
         v4.addWidget(self.tetra_output)
 
         # Tab 5: Zellen
         tab5 = QtWidgets.QWidget()
         v5 = QtWidgets.QVBoxLayout(tab5)
-        self.cell_table = QtWidgets.QTableWidget(0, 5)
-        self.cell_table.setHorizontalHeaderLabels(
-            ["Zell-ID", "LAC", "MCC", "MNC", "Frequenz"]
-        )
+        self.cell_model = CellModel(self)
+        self.cell_table = QtWidgets.QTableView()
+        self.cell_table.setModel(self.cell_model)
         v5.addWidget(self.cell_table)
         self.export_cells_btn = QtWidgets.QPushButton("CSV-Export")
         v5.addWidget(self.export_cells_btn)
@@ -1787,25 +3280,22 @@ class MainWindow(QtWidgets.QMainWindow):
         v6 = QtWidgets.QVBoxLayout(tab6)
         self.stats_canvas = FigureCanvas(Figure(figsize=(4,3)))
         self.stats_ax = self.stats_canvas.figure.add_subplot(111)
+        # Balken einmal anlegen und später nur Höhen setzen und blitten
+        self._stats_bars = self.stats_ax.bar(list(PACKET_TYPES), [0] * len(PACKET_TYPES))
+        for rect in self._stats_bars:
+            rect.set_animated(True)
+        self.stats_ax.set_ylim(0, 10)
+        self._stats_bg = None
+        # Zähler geändert, während der Statistik-Reiter verdeckt war
+        self._stats_stale = False
+        self.stats_canvas.mpl_connect("draw_event", self._cache_stats_background)
         v6.addWidget(self.stats_canvas)
 
         # Tab 7: Sprechgruppen
         tab7 = QtWidgets.QWidget()
         v7 = QtWidgets.QVBoxLayout(tab7)
-        self.talkgroup_table = QtWidgets.QTableWidget(0, 4)
-        self.talkgroup_table.setHorizontalHeaderLabels(
-            ["Auswahl", "TG-ID", "Treffer", "Letzte Aktivität"]
-        )
-        self.talkgroup_table.horizontalHeader().setStretchLastSection(True)
-        self.talkgroup_table.horizontalHeader().setSectionResizeMode(
-            0, QtWidgets.QHeaderView.ResizeToContents
-        )
-        self.talkgroup_table.horizontalHeader().setSectionResizeMode(
-            1, QtWidgets.QHeaderView.ResizeToContents
-        )
-        self.talkgroup_table.horizontalHeader().setSectionResizeMode(
-            2, QtWidgets.QHeaderView.ResizeToContents
-        )
+        # Modell und Spaltenbreiten folgen, sobald die Sprechgruppen geladen sind
+        self.talkgroup_table = QtWidgets.QTableView()
         auswahl_layout = QtWidgets.QHBoxLayout()
         self.talkgroup_select_all_btn = QtWidgets.QPushButton("Alle auswählen")
         self.talkgroup_select_none_btn = QtWidgets.QPushButton("Alle abwählen")
@@ -1822,12 +3312,30 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tabs.addTab(tab5, "Zellen")
         self.tabs.addTab(tab6, "Statistik")
         self.tabs.addTab(tab7, "Sprechgruppen")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
-    def refresh_devices(self):
-        """Füllt die Geräteauswahl mit erkannten SDR-Geräten."""
+    def refresh_devices(self, force: bool = False):
+        """Füllt die Geräteauswahl; force sucht neu statt den Zwischenspeicher zu nutzen."""
+        if self._device_probe_signals is not None:
+            return
+        self.device_box.clear()
+        self.device_box.addItem("Suche Geräte...", None)
+        self.device_box.setEnabled(False)
+        # Ohne Gerätewahl würde ein Start still ohne Geräteindex laufen
+        self.start_btn.setEnabled(False)
+        probe = DeviceProbe(force)
+        self._device_probe_signals = probe.signals
+        probe.signals.done.connect(self._populate_devices)
+        QtCore.QThreadPool.globalInstance().start(probe)
+
+    @QtCore.pyqtSlot(list)
+    def _populate_devices(self, devices):
+        self._device_probe_signals = None
         self.device_box.clear()
-        for label, device_id in list_sdr_devices():
+        for label, device_id in devices:
             self.device_box.addItem(label, device_id)
+        self.device_box.setEnabled(True)
+        self.start_btn.setEnabled(True)
 
     def _current_device_info(self):
         name = self.device_box.currentText()
@@ -1850,47 +3358,155 @@ class MainWindow(QtWidgets.QMainWindow):
         self.player.ppm = value
         self.decoder.ppm = value
 
+    @QtCore.pyqtSlot(int)
+    def _on_tab_changed(self, index: int):
+        # Aufgehobenes Spektrum nachholen, sobald der Reiter sichtbar ist
+        if self._latest_spectrum is not None and not self._spectrum_timer.isActive():
+            self._spectrum_timer.start()
+        # Statistik nur nachzeichnen, wenn ihr Reiter jetzt tatsächlich sichtbar ist
+        if self._stats_stale and self.stats_canvas.isVisible():
+            self._mark_ui_dirty("stats")
+
+    @QtCore.pyqtSlot(np.ndarray, np.ndarray)
+    def _queue_spectrum(self, freqs, powers):
+        self._latest_spectrum = (freqs, powers)
+        if not self._spectrum_timer.isActive():
+            self._spectrum_timer.start()
+
+    def _draw_latest_spectrum(self, force: bool = False):
+        if self._latest_spectrum is None:
+            return
+        # Verdeckter Reiter: neuestes Spektrum aufheben und erst beim Anzeigen zeichnen
+        if not force and not self.canvas.isVisible():
+            return
+        freqs, powers = self._latest_spectrum
+        self._latest_spectrum = None
+        self.canvas.update_spectrum(freqs, powers)
+
+    def _reset_scan_results(self):
+        self._scan_start = None
+        self._scan_bin_hz = None
+        self._scan_power = None
+        self._scan_freq = None
+        self._scan_top = None
+
     @QtCore.pyqtSlot(np.ndarray, np.ndarray)
     def _update_scan_results(self, freqs, powers):
         """Aggregiert Scan-Peaks und aktualisiert die Frequenzliste."""
         if freqs is None or powers is None or len(freqs) == 0 or len(powers) == 0:
             return
 
-        bin_hz = freqs[1] - freqs[0] if len(freqs) > 1 else 1.0
+        if len(freqs) > 1:
+            bin_hz = float(freqs[1] - freqs[0])
+        elif self._scan_bin_hz:
+            # Einzelner Wert: bisherige Schrittweite beibehalten statt neu anzulegen
+            bin_hz = self._scan_bin_hz
+        else:
+            # Ohne bekannte Schrittweite lässt sich kein Raster anlegen
+            return
         if bin_hz <= 0:
             return
 
-        bin_indices = np.rint(freqs / bin_hz).astype(int)
-        for idx, freq, power in zip(bin_indices, freqs, powers):
-            current = self.scan_results.get(idx)
-            if current is None or power > current["power"]:
-                self.scan_results[idx] = {"freq": freq, "power": power}
-
-        if len(self.scan_results) > 200:
-            top_items = sorted(
-                self.scan_results.items(),
-                key=lambda item: item[1]["power"],
-                reverse=True,
-            )[:200]
-            self.scan_results = dict(top_items)
-
-        top_peaks = sorted(
-            self.scan_results.values(),
-            key=lambda item: item["power"],
-            reverse=True,
-        )[:20]
-
-        self.freq_list.clear()
-        for entry in top_peaks:
-            freq_mhz = entry["freq"] / 1e6
-            text = f"{freq_mhz:.3f} MHz \u2013 {entry['power']:.1f} dB"
-            item = QtWidgets.QListWidgetItem(text)
-            item.setData(QtCore.Qt.UserRole, entry["freq"])
-            self.freq_list.addItem(item)
+        # Schrittweite mit Toleranz vergleichen: f0 + i * bin_hz ist nicht bitgenau
+        if self._scan_power is None or abs(bin_hz - self._scan_bin_hz) > bin_hz * 1e-6:
+            # Ein Eintrag je Frequenz-Bin über den gesamten Scanbereich
+            f_start, f_end = self._scan_range or (float(freqs[0]), float(freqs[-1]))
+            f_end = max(f_end, float(freqs[-1]))
+            f_start = min(f_start, float(freqs[0]))
+            nbins = int(np.ceil((f_end - f_start) / bin_hz)) + 1
+            self._scan_start = f_start
+            self._scan_bin_hz = bin_hz
+            self._scan_power = np.full(nbins, -np.inf, dtype=np.float32)
+            self._scan_freq = np.zeros(nbins)
+
+        # Ein Zwischenpuffer, Division und Rundung in place; Indizes bleiben ein
+        # intp-Array für die Fancy-Indexierung, keine Python-Ints je Bin
+        bin_hz = self._scan_bin_hz
+        pos = freqs - self._scan_start
+        pos /= bin_hz
+        np.rint(pos, out=pos)
+        bin_indices = pos.astype(np.intp)
+        vorne = max(0, -int(bin_indices.min()))
+        hinten = max(0, int(bin_indices.max()) - (len(self._scan_power) - 1))
+        if vorne or hinten:
+            # Zeile reicht über den bisherigen Bereich hinaus: Akkumulator erweitern
+            # statt die Bins stillschweigend zu verwerfen
+            self._scan_power = np.concatenate((
+                np.full(vorne, -np.inf, dtype=np.float32),
+                self._scan_power,
+                np.full(hinten, -np.inf, dtype=np.float32),
+            ))
+            self._scan_freq = np.concatenate(
+                (np.zeros(vorne), self._scan_freq, np.zeros(hinten))
+            )
+            self._scan_start -= vorne * bin_hz
+            bin_indices += vorne
+            logger.info(
+                f"Scanbereich erweitert auf {self._scan_start / 1e6:.3f}–"
+                f"{(self._scan_start + (len(self._scan_power) - 1) * bin_hz) / 1e6:.3f} MHz"
+            )
+        vorher = self._scan_power[bin_indices]
+        if len(bin_indices) < 2 or (bin_indices[1:] > bin_indices[:-1]).all():
+            # Üblicher Fall: rtl_power liefert aufsteigende, eindeutige Bins; dann
+            # genügt eine maskierte Zuweisung statt des ungepufferten maximum.at
+            besser = powers > vorher
+            ziel = bin_indices[besser]
+            self._scan_power[ziel] = powers[besser]
+        else:
+            # Mehrere Werte im selben Bin: Maximum per ufunc statt "letzter gewinnt"
+            np.maximum.at(self._scan_power, bin_indices, powers)
+            besser = (powers > vorher) & (powers == self._scan_power[bin_indices])
+            ziel = bin_indices[besser]
+        self._scan_freq[ziel] = freqs[besser]
+
+        k = min(20, len(self._scan_power))
+        top_idx = np.argpartition(self._scan_power, -k)[-k:]
+        # Leere Bins (-inf) erst unter den k Kandidaten aussortieren
+        top_idx = top_idx[np.isfinite(self._scan_power[top_idx])]
+        top_idx = top_idx[np.argsort(self._scan_power[top_idx])[::-1]]
+        # Zwei tolist()-Aufrufe statt einzelner Skalarzugriffe und Dicts je Peak
+        top_freq = self._scan_freq[top_idx].tolist()
+        top_power = self._scan_power[top_idx].tolist()
+        # Liste nur neu aufbauen, wenn sich die Top-Peaks geändert haben
+        top_key = tuple(zip(top_freq, [round(p, 1) for p in top_power]))
+        if top_key == self._scan_top:
+            return
+        self._scan_top = top_key
+
+        # Vorhandene Einträge umschreiben statt die Liste zu leeren und neu anzulegen
+        liste = self.freq_list
+        liste.setUpdatesEnabled(False)
+        try:
+            for i, (freq, power) in enumerate(zip(top_freq, top_power)):
+                text = f"{freq / 1e6:.3f} MHz \u2013 {power:.1f} dB"
+                item = liste.item(i)
+                if item is None:
+                    item = QtWidgets.QListWidgetItem()
+                    liste.addItem(item)
+                item.setText(text)
+                item.setData(QtCore.Qt.UserRole, freq)
+            while liste.count() > len(top_freq):
+                liste.takeItem(liste.count() - 1)
+        finally:
+            liste.setUpdatesEnabled(True)
 
     @QtCore.pyqtSlot(float)
     def update_frequency(self, freq):
         """Neue Frequenzauswahl verarbeiten."""
+        # rtl_power meldet pro Zeile einen Peak; unveränderte Wiederholungen
+        # würden Log, Verlauf und rtl_fm bei jedem Sweep erneut anstoßen
+        if freq == self._last_scan_freq:
+            return
+        self._last_scan_freq = freq
+        # Wechsel innerhalb von 500 ms zusammenfassen, nur der letzte startet rtl_fm
+        self._pending_freq = freq
+        if not self._freq_timer.isActive():
+            self._freq_timer.start()
+
+    def _apply_pending_frequency(self):
+        freq, self._pending_freq = self._pending_freq, None
+        if freq is None:
+            return
         if self.manual_lock:
             self.log.appendPlainText(
                 f"Automatische Frequenz ignoriert (Manuell aktiv): {freq/1e6:.3f} MHz"
@@ -1912,6 +3528,7 @@ class MainWindow(QtWidgets.QMainWindow):
         """Gemeinsamer Einstieg zum Setzen der Frequenz und Starten des Players."""
         self.freq_label.setText(f"Frequenz: {freq/1e6:.3f} MHz")
         if source == "manual":
+            self._last_scan_freq = None
             self.log.appendPlainText(f"Manuell ausgew\u00e4hlt: {freq/1e6:.3f} MHz")
         else:
             self.log.appendPlainText(f"Gew\u00e4hlte Frequenz: {freq/1e6:.3f} MHz")
@@ -1924,6 +3541,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _set_manual_lock(self, enabled: bool):
         self.manual_lock = enabled
+        self._last_scan_freq = None
         if self.manual_lock_btn.isChecked() != enabled:
             self.manual_lock_btn.blockSignals(True)
             self.manual_lock_btn.setChecked(enabled)
@@ -1935,11 +3553,14 @@ class MainWindow(QtWidgets.QMainWindow):
     def _toggle_manual_lock(self, enabled: bool):
         self._set_manual_lock(enabled)
 
-    @QtCore.pyqtSlot()
-    def notify_activity(self):
-        """Visuelle Anzeige, wenn Aktivität erkannt wird."""
-        self.activity_led.set_color("red")
-        QtCore.QTimer.singleShot(500, lambda: self.activity_led.set_color("green"))
+    @QtCore.pyqtSlot(bool)
+    def notify_activity(self, active: bool):
+        """Visuelle Anzeige, solange Aktivität erkannt wird (plus 500 ms Nachlauf)."""
+        if active:
+            self._activity_timer.stop()
+            self.activity_led.set_color("red")
+        else:
+            self._activity_timer.start()
 
     def start_decoding(self):
         """Startet die TETRA-Dekodierkette."""
@@ -1950,6 +3571,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.decoder.device_id = device_id
         self.tetra_start_btn.setEnabled(False)
         self.tetra_stop_btn.setEnabled(True)
+        self._pending_tetra = []
         self.tetra_output.clear()
         rec = self.record_audio_cb.isChecked()
         if self.play_audio_cb.isChecked():
@@ -1979,21 +3601,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.dec_audio_player.stop()
         QtWidgets.QMessageBox.information(self, "Info", "Verschl\u00fcsseltes Signal erkannt")
 
-    def _append_tetra(self, line: str):
-        if not self._line_matches_selected_talkgroup(line):
-            return
-        flt = self.filter_edit.text()
-        if flt:
-            try:
-                if not re.search(flt, line):
-                    return
-            except re.error:
-                pass
-        self.tetra_output.appendPlainText(line)
+    def _update_filter_re(self, text: str):
+        self._line_parser.filter_re = compile_filter_regex(text)
+
+    def _sync_parser_selection(self):
+        selected = frozenset(self.selected_talkgroups)
+        self._line_parser.selection = (selected, talkgroup_prefilter(selected))
+
+    @QtCore.pyqtSlot(str, object, str, object)
+    def _handle_parsed_line(self, line: str, cell, packet: str, ids):
+        # Ein appendPlainText je Flush statt Layout je Zeile
+        self._pending_tetra.append(line)
+        self._mark_ui_dirty("tetra")
         logger.info(line)
-        self.parse_cell_info(line)
-        self.parse_packet_type(line)
-        self.parse_talkgroups(line)
+        if cell:
+            self.update_cells(dict(zip(CELL_FIELDS, (*cell, self._freq_mhz3))))
+        if packet:
+            self._count_packet(packet)
+        if ids:
+            self.parse_talkgroups(line, ids)
 
     def _decoder_finished(self):
         self.tetra_start_btn.setEnabled(True)
@@ -2014,6 +3640,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_ppm(self.ppm_spin.value())
         rng = self.freq_range_box.currentData()
         f_start, f_end = rng if rng else (380e6, 430e6)
+        if self._scan_range != (f_start, f_end):
+            self._scan_range = (f_start, f_end)
+            self._reset_scan_results()
         if device_id is None:
             device_text = "ohne Index"
         else:
@@ -2026,76 +3655,156 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def stop(self):
         self.log.appendPlainText("Stoppe")
+        self._freq_timer.stop()
+        self._pending_freq = None
         self.scanner.stop()
         self.player.stop()
         self.stop_decoding()
 
     def closeEvent(self, event):
+        self._pending_save.stop()
+        self.player.close()
+        self._parser_thread.quit()
+        self._parser_thread.wait()
         self._persist_talkgroups_to_config()
         self._persist_selected_talkgroups_to_config()
         save_config(self.config)
         super().closeEvent(event)
 
+    def _set_config_value(self, key: str, value):
+        """Setzt einen Konfigurationswert und speichert verzögert."""
+        self.config[key] = value
+        # Mehrere Änderungen kurz hintereinander ergeben nur einen Schreibvorgang
+        self._pending_save.start()
+
+    def _save_config(self):
+        if self._selection_dirty:
+            self._persist_selected_talkgroups_to_config()
+        save_config(self.config)
+
     # ----- Hilfsmethoden -----
     def apply_theme(self, theme: str):
-        if theme == "dark" and qdarkstyle:
-            self.setStyleSheet(qdarkstyle.load_stylesheet_pyqt5())
+        self.config["theme"] = theme
+        # setStyleSheet poliert alle Widgets neu, daher nur bei echtem Wechsel
+        if theme == self._applied_theme:
+            return
+        self._applied_theme = theme
+        qdarkstyle = _lade_qdarkstyle() if theme == "dark" else None
+        if qdarkstyle:
+            if MainWindow._QDARK_SS is None:
+                MainWindow._QDARK_SS = qdarkstyle.load_stylesheet_pyqt5()
+            self.setStyleSheet(MainWindow._QDARK_SS)
         else:
             self.setStyleSheet("")
-        self.config["theme"] = theme
 
     def _on_theme_change(self, index: int):
         theme_value = self.theme_combo.itemData(index) or "light"
         self.apply_theme(theme_value)
 
     def save_spectrum_png(self):
+        self._draw_latest_spectrum(force=True)
         path = os.path.expanduser("~/TetraScans")
         os.makedirs(path, exist_ok=True)
         fname = datetime.now().strftime("scan_%Y%m%d_%H%M%S.png")
-        self.canvas.fig.savefig(os.path.join(path, fname))
+        self.canvas.save_png(os.path.join(path, fname))
         self.log.appendPlainText(f"Spektrum gespeichert: {fname}")
 
     def run_scheduled_cycle(self):
+        # Während der Gerätesuche ist noch kein Gerät gewählt; Zyklus auslassen
+        if self._device_probe_signals is not None:
+            return
         self.start()
-        QtCore.QTimer.singleShot(5000, self._run_decode_phase)
+        self._decode_timer.start(5000)
 
     def _run_decode_phase(self):
         self.scanner.stop()
         if self.current_frequency:
             self.start_decoding()
-        QtCore.QTimer.singleShot(60000, self.stop)
+        self._stop_timer.start(60000)
 
     def send_telegram(self, text: str):
         token = self.token_edit.text().strip()
         chat = self.chat_edit.text().strip()
-        if not token or not chat or not requests:
+        if not token or not chat:
             return
-        threading.Thread(
-            target=requests.post,
-            args=(f"https://api.telegram.org/bot{token}/sendMessage",),
-            kwargs={"data": {"chat_id": chat, "text": text}},
-            daemon=True,
-        ).start()
+        self._telegram.send(token, chat, text)
 
     def update_cells(self, cell):
         cid = cell.get("cell")
         if not cid:
             return
+        alt = self.cells.get(cid)
+        if alt is not None:
+            self.cells.move_to_end(cid)
+            # Unveränderte Zelle: Tabelle muss nicht aktualisiert werden
+            if alt == cell:
+                return
         self.cells[cid] = cell
-        self.cell_table.setRowCount(len(self.cells))
-        for row, info in enumerate(self.cells.values()):
-            self.cell_table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(info.get("cell", ""))))
-            self.cell_table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(info.get("lac", ""))))
-            self.cell_table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(info.get("mcc", ""))))
-            self.cell_table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(info.get("mnc", ""))))
-            self.cell_table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(info.get("freq", ""))))
+        self._pending_cells[cid] = cell
+        # Älteste Zelle verwerfen, damit Speicher und Tabelle begrenzt bleiben
+        while len(self.cells) > self._cells_max:
+            alt_cid, _ = self.cells.popitem(last=False)
+            self._pending_cells.pop(alt_cid, None)
+            self._evicted_cells.append(alt_cid)
+        self._mark_ui_dirty("cells")
+
+    def _mark_ui_dirty(self, part: str):
+        self._ui_dirty.add(part)
+        if not self._ui_timer.isActive():
+            self._ui_timer.start()
+
+    def _flush_ui(self):
+        dirty, self._ui_dirty = self._ui_dirty, set()
+        if "tetra" in dirty and self._pending_tetra:
+            zeilen, self._pending_tetra = self._pending_tetra, []
+            # Mehr als das Blocklimit würde Qt ohnehin sofort wieder verwerfen
+            self.tetra_output.appendPlainText("\n".join(zeilen[-MAX_OUTPUT_LINES:]))
+        if "cells" in dirty:
+            self.cell_model.remove(self._evicted_cells)
+            for cid, cell in self._pending_cells.items():
+                if cid in self.cells:
+                    self.cell_model.upsert(cell)
+            self._evicted_cells = []
+            self._pending_cells = {}
+        if "tg" in dirty and self._pending_tg_ids:
+            ids, self._pending_tg_ids = self._pending_tg_ids, {}
+            # Mehrere Zeilenverschiebungen in einem einzigen Neuzeichnen zusammenfassen
+            self.talkgroup_table.setUpdatesEnabled(False)
+            try:
+                self.talkgroup_model.touch(ids)
+            finally:
+                self.talkgroup_table.setUpdatesEnabled(True)
+        if "stats" in dirty:
+            self.update_stats()
+
+    def _cache_stats_background(self, event=None):
+        """Hintergrund nach jedem vollständigen Zeichnen sichern und Balken darüberlegen."""
+        self._stats_bg = self.stats_canvas.copy_from_bbox(self.stats_ax.bbox)
+        for rect in self._stats_bars:
+            self.stats_ax.draw_artist(rect)
 
     def update_stats(self):
-        self.stats_ax.clear()
-        types = list(self.packet_counts.keys())
-        vals = [self.packet_counts[t] for t in types]
-        self.stats_ax.bar(types, vals)
-        self.stats_canvas.draw()
+        # Verdeckter Reiter: Zählerstand erst beim Anzeigen zeichnen
+        if not self.stats_canvas.isVisible():
+            self._stats_stale = True
+            return
+        self._stats_stale = False
+        vals = [self.packet_counts[t] for t in self._bar_keys]
+        for rect, val in zip(self._stats_bars, vals):
+            rect.set_height(val)
+        top = max(vals)
+        if top >= self.stats_ax.get_ylim()[1]:
+            # Nur wenn die Achse wachsen muss, komplett neu zeichnen
+            self.stats_ax.set_ylim(0, max(10, top * 1.5))
+            self.stats_canvas.draw_idle()
+            return
+        if self._stats_bg is None:
+            self.stats_canvas.draw_idle()
+            return
+        self.stats_canvas.restore_region(self._stats_bg)
+        for rect in self._stats_bars:
+            self.stats_ax.draw_artist(rect)
+        self.stats_canvas.blit(self.stats_ax.bbox)
 
     def export_cells_csv(self):
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -2106,17 +3815,20 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if not path:
             return
-        with open(path, "w") as fh:
-            fh.write("Zelle,LAC,MCC,MNC,Frequenz\n")
-            for c in self.cells.values():
-                fh.write(
-                    f"{c.get('cell','')},{c.get('lac','')},"
-                    f"{c.get('mcc','')},{c.get('mnc','')},{c.get('freq','')}\n"
-                )
+        try:
+            write_cells_csv(path, self.cells.values())
+        except OSError as exc:
+            self.log.appendPlainText(f"Konnte CSV nicht schreiben: {exc}")
+        else:
+            self.log.appendPlainText(f"CSV-Export abgeschlossen: {path}")
 
     def update_scheduler(self):
         enabled = self.scheduler_enable_cb.isChecked()
         interval = self.scheduler_interval_spin.value()
+        # Unveränderte Einstellungen würden den Timer nur neu anstoßen
+        if self._sched_applied == (enabled, interval):
+            return
+        self._sched_applied = (enabled, interval)
         self.config["scheduler_enabled"] = enabled
         self.config["scheduler_interval"] = interval
         if enabled:
@@ -2124,105 +3836,61 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self.scheduler_timer.stop()
 
-    def parse_cell_info(self, line: str):
-        m = re.search(r"Cell\s*ID[:=]\s*(\w+).*LAC[:=]\s*(\w+).*MCC[:=]\s*(\d+).*MNC[:=]\s*(\d+)", line, re.I)
-        if not m:
-            return
-        cell = {
-            "cell": m.group(1),
-            "lac": m.group(2),
-            "mcc": m.group(3),
-            "mnc": m.group(4),
-            "freq": f"{self.current_frequency/1e6:.3f}"
-        }
-        self.update_cells(cell)
-
-    def parse_packet_type(self, line: str):
-        types = ["SDS", "MM", "CM"]
-        for t in types:
-            if t in line:
-                self.packet_counts[t] = self.packet_counts.get(t, 0) + 1
-                self.update_stats()
-                self.send_telegram(
-                    f"TETRA-Aktivit\u00e4t auf {self.current_frequency/1e6:.4f} MHz: {t} empfangen"
-                )
-                break
+    def _count_packet(self, t: str):
+        self.packet_counts[t] += 1
+        self._mark_ui_dirty("stats")
+        self.send_telegram(
+            f"TETRA-Aktivit\u00e4t auf {self._freq_mhz4} MHz: {t} empfangen"
+        )
 
-    def parse_talkgroups(self, line: str):
-        ids = self._extract_talkgroup_ids(line)
+    def parse_talkgroups(self, line: str, ids=None):
+        if ids is None:
+            ids = self._extract_talkgroup_ids(line)
         if not ids:
             return
         now = datetime.now()
+        # Anzeigetext einmal pro Ereignis formatieren statt bei jedem Zeichnen
+        now_str = now.strftime(TALKGROUP_TIME_FORMAT)
+        pending = self._pending_tg_ids
         for tg_id in ids:
-            info = self.talkgroups.get(tg_id, {"count": 0, "last_seen": now})
+            info = self.talkgroups.get(tg_id)
+            if info is None:
+                info = self.talkgroups[tg_id] = {"count": 0}
             info["count"] = info.get("count", 0) + 1
             info["last_seen"] = now
-            self.talkgroups[tg_id] = info
-        self._update_talkgroups_table()
+            info["last_seen_str"] = now_str
+            self.talkgroups.move_to_end(tg_id, last=False)
+            # Wiederholte Treffer bis zum nächsten Flush nur einmal nach oben ziehen
+            pending.pop(tg_id, None)
+            pending[tg_id] = None
+        self._mark_ui_dirty("tg")
 
     def _extract_talkgroup_ids(self, line: str):
         return extract_talkgroup_ids(line)
 
-    def _update_talkgroups_table(self):
-        if not hasattr(self, "talkgroup_table"):
-            return
-        sortiert = sorted(
-            self.talkgroups.items(),
-            key=lambda item: item[1].get("last_seen") or datetime.min,
-            reverse=True,
-        )
-        self.talkgroup_table.blockSignals(True)
-        self.talkgroup_table.setRowCount(len(sortiert))
-        for row, (tg_id, info) in enumerate(sortiert):
-            count = info.get("count", 0)
-            last_seen = info.get("last_seen")
-            last_text = last_seen.strftime("%Y-%m-%d %H:%M:%S") if last_seen else ""
-            auswahl_item = QtWidgets.QTableWidgetItem("")
-            auswahl_item.setFlags(
-                auswahl_item.flags() | QtCore.Qt.ItemIsUserCheckable
-            )
-            auswahl_item.setCheckState(
-                QtCore.Qt.Checked
-                if str(tg_id) in self.selected_talkgroups
-                else QtCore.Qt.Unchecked
-            )
-            self.talkgroup_table.setItem(row, 0, auswahl_item)
-            self.talkgroup_table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(tg_id)))
-            self.talkgroup_table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(count)))
-            self.talkgroup_table.setItem(row, 3, QtWidgets.QTableWidgetItem(last_text))
-        self.talkgroup_table.blockSignals(False)
-
-    def _handle_talkgroup_selection_change(self, item: QtWidgets.QTableWidgetItem):
-        if item.column() != 0:
-            return
-        tg_item = self.talkgroup_table.item(item.row(), 1)
-        if not tg_item:
-            return
-        tg_id = str(tg_item.text()).strip()
+    def _handle_talkgroup_selection_change(self, tg_id: str, checked: bool):
+        tg_id = tg_id.strip()
         if not tg_id:
             return
-        if item.checkState() == QtCore.Qt.Checked:
+        if checked:
             self.selected_talkgroups.add(tg_id)
         else:
             self.selected_talkgroups.discard(tg_id)
-        self._persist_selected_talkgroups_to_config()
+        self._mark_selection_dirty()
+        self._sync_parser_selection()
 
     def _set_all_talkgroup_selection(self, selected: bool):
-        ids = {str(tg_id) for tg_id in self.talkgroups.keys()}
         if selected:
-            self.selected_talkgroups = ids
+            self.selected_talkgroups = set(self.talkgroups)
         else:
             self.selected_talkgroups = set()
-        self._persist_selected_talkgroups_to_config()
-        self._update_talkgroups_table()
-
-    def _line_matches_selected_talkgroup(self, line: str) -> bool:
-        if not self.selected_talkgroups:
-            return True
-        ids = self._extract_talkgroup_ids(line)
-        if not ids:
-            return False
-        return any(tg_id in self.selected_talkgroups for tg_id in ids)
+        self._mark_selection_dirty()
+        self._sync_parser_selection()
+        self.talkgroup_table.setUpdatesEnabled(False)
+        try:
+            self.talkgroup_model.set_selected(self.selected_talkgroups)
+        finally:
+            self.talkgroup_table.setUpdatesEnabled(True)
 
     def _load_talkgroups_from_config(self):
         gespeicherte = self.config.get("talkgroups", {})
@@ -2241,7 +3909,16 @@ class MainWindow(QtWidgets.QMainWindow):
             self.talkgroups[str(tg_id)] = {
                 "count": int(info.get("count", 0)),
                 "last_seen": parsed_last,
+                "last_seen_str": (
+                    parsed_last.strftime(TALKGROUP_TIME_FORMAT) if parsed_last else ""
+                ),
             }
+        # Einmalig nach letzter Aktivität ordnen, danach nur noch verschieben
+        for tg_id in sorted(
+            self.talkgroups,
+            key=lambda tg_id: self.talkgroups[tg_id].get("last_seen") or datetime.min,
+        ):
+            self.talkgroups.move_to_end(tg_id, last=False)
 
     def _load_selected_talkgroups_from_config(self):
         gespeicherte = self.config.get("selected_talkgroups", [])
@@ -2254,13 +3931,18 @@ class MainWindow(QtWidgets.QMainWindow):
         gespeicherte = {}
         for tg_id, info in self.talkgroups.items():
             last_seen = info.get("last_seen")
-            gespeicherte[str(tg_id)] = {
+            gespeicherte[tg_id] = {
                 "count": int(info.get("count", 0)),
                 "last_seen": last_seen.isoformat() if last_seen else "",
             }
         self.config["talkgroups"] = gespeicherte
 
+    def _mark_selection_dirty(self):
+        self._selection_dirty = True
+        self._pending_save.start()
+
     def _persist_selected_talkgroups_to_config(self):
+        self._selection_dirty = False
         self.config["selected_talkgroups"] = sorted(self.selected_talkgroups)
 
 